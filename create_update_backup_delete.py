@@ -8,12 +8,19 @@
 # ============================================================
 
 # ---------------------------- IMPORTS & GLOBALS ----------------------------
-import os, re, sys, json, io, shutil, traceback, copy, time, hashlib
+import os, re, sys, json, io, shutil, traceback, time, threading
+import gzip, sqlite3, tempfile
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from difflib import SequenceMatcher
+from functools import lru_cache
+from operator import itemgetter
+from urllib.parse import urlparse
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from urllib3.util.retry import Retry
 
 SCRIPT_VERSION = "v12.1.2"
 
@@ -59,6 +66,16 @@ JSON_OBJECT_TEMPLATE = {
     },
 }
 
+
+def new_show_object():
+    # Every container in the template is empty or holds only None, so copying
+    # each one level deep is a full copy without deepcopy's per-object walk.
+    return {
+        k: v.copy() if isinstance(v, (list, dict)) else v
+        for k, v in JSON_OBJECT_TEMPLATE.items()
+    }
+
+
 SITE_PRIORITY_BY_LANGUAGE = {
     "korean": {
         "synopsis": "asianwiki",
@@ -166,7 +183,27 @@ FIELD_NAME_MAP = {
     "sitePriorityUsed": "Site Priority Used",
 }
 
-LOCKED_FIELDS_AFTER_CREATION = {
+LOCKED_FIELDS_AFTER_CREATION = frozenset(
+    {
+        "synopsis",
+        "showImage",
+        "otherNames",
+        "releaseDate",
+        "Duration",
+        "director",
+        "tags",
+        "cast",
+        "updatedOn",
+        "updatedDetails",
+        "sitePriorityUsed",
+        "topRatings",
+        "network",
+        "airedOn",
+    }
+)
+
+# Scraped metadata fields, in the order they are fetched and reported.
+METADATA_FIELDS = (
     "synopsis",
     "showImage",
     "otherNames",
@@ -175,15 +212,102 @@ LOCKED_FIELDS_AFTER_CREATION = {
     "director",
     "tags",
     "cast",
-    "updatedOn",
-    "updatedDetails",
-    "sitePriorityUsed",
-    "topRatings",
     "network",
     "airedOn",
-}
+)
+# Movies have no broadcast network or airing schedule to fetch or flag.
+MOVIE_METADATA_FIELDS = tuple(
+    f for f in METADATA_FIELDS if f not in ("network", "airedOn")
+)
+# (field, report label) pairs in label order, so the per-show "Fetched" and
+# "Missing" lists come out sorted without building and sorting them each time.
+METADATA_LABELS = tuple(
+    sorted(((f, FIELD_NAME_MAP.get(f, f)) for f in METADATA_FIELDS), key=itemgetter(1))
+)
+MOVIE_METADATA_LABELS = tuple(
+    (f, label) for f, label in METADATA_LABELS if f in MOVIE_METADATA_FIELDS
+)
+
+# Fields owned by the Excel sheet, i.e. the ones compared to detect row edits.
+_EXCEL_DIFF_FIELDS = frozenset(FIELD_NAME_MAP) - LOCKED_FIELDS_AFTER_CREATION
+_EXCEL_DIFF_KEYS = tuple(_EXCEL_DIFF_FIELDS)
+
+# Languages whose shows get metadata scraped; everything else is only listed.
+ASIAN_LANGUAGES = frozenset(
+    {"korean", "chinese", "japanese", "thai", "taiwanese", "filipino"}
+)
+
+# Report sections that list changes but are left out of the per-sheet row stats
+SKIP_STAT_SHEETS = frozenset({"Deleting Records", "Manual Updates"})
+# All the report prints for a created/updated show; report_data (and the batch
+# state it is saved into between runs) keeps these instead of whole records.
+REPORT_ENTRY_FIELDS = ("showID", "showName", "releasedYear", "updatedDetails")
+
+# ---------------------------- REGEX PATTERNS ----------------------------
+SEASON_SUFFIX_RE = re.compile(r"\b(?:Season|Part|S)\s*\d+\b|\s+\d+$", re.IGNORECASE)
+SEASON_NUMBER_RE = re.compile(r"\b(?:Season|Part|S)\s*(\d+)\b", re.IGNORECASE)
+TRAILING_NUMBER_RE = re.compile(r"\s+(\d+)$")
+URL_SEASON_RE = re.compile(r"(?:season|part)[-_]*(\d+)", re.IGNORECASE)
+YEAR_IN_PARENS_RE = re.compile(r"\(\d{4}\)")
+PARENTHESIZED_RE = re.compile(r"\(.*?\)")
+ALIAS_SPLIT_RE = re.compile(r"[/,]")
+IMAGE_SIZE_SUFFIX_RE = re.compile(r"_[24]c\.jpg$")
+# Search results that point at sub-pages rather than a show's main page.
+BAD_RESULT_URL_RE = re.compile(
+    r"/reviews|/recs|\?lang=|/photos|/video|/trivia|/people/|/article/|/list/"
+    r"|/cast|/episodes",
+    re.IGNORECASE,
+)
+ASIANWIKI_NON_ARTICLE_RE = re.compile(r"category:|file:|/index\.php", re.IGNORECASE)
+LEADING_COLON_RE = re.compile(r"^[:\s]+")
+TRAILING_JUNK_RE = re.compile(r"[\s\(\-\[\]\,]+$")
+EDGE_PUNCT_RE = re.compile(r"^[,:\-\s]+|[,:\-\s]+$")
+PLOT_HEADING_RE = re.compile(r"(Plot|Synopsis)", re.IGNORECASE)
+PLOT_HEADING_START_RE = re.compile(r"^(Plot|Synopsis)", re.IGNORECASE)
+PEOPLE_ID_RE = re.compile(r"/people/(\d+)")
+CAST_ITEM_CLASS_RE = re.compile(r"\b(list-item|col-(?:sm|md|lg)-\d+|row)\b")
+
+MDL_ALIAS_LABEL_RE = re.compile(r"^\s*(Also Known As|Native Title).*", re.IGNORECASE)
+MDL_AKA_LABEL_RE = re.compile(r"^\s*Also Known As.*", re.IGNORECASE)
+MDL_DURATION_LABEL_RE = re.compile(r"^\s*Duration.*", re.IGNORECASE)
+MDL_AIRED_LABEL_RE = re.compile(r"^\s*Aired[\s:]*$", re.IGNORECASE)
+MDL_DIRECTOR_LABEL_RE = re.compile(r"^\s*Director.*", re.IGNORECASE)
+MDL_NETWORK_LABEL_RE = re.compile(r"^\s*Original Network.*", re.IGNORECASE)
+MDL_AIRED_ON_LABEL_RE = re.compile(r"^\s*Aired On.*", re.IGNORECASE)
+
+MDL_SYNOPSIS_JUNK_RES = [
+    re.compile(pattern, re.IGNORECASE | re.DOTALL)
+    for pattern in [
+        r"\s*\(Source:.*?\)\s*$",
+        r"\s*Source:.*$",
+        r"~~.*",
+        r"\s*Edit Translation\s*$",
+        r"\s*(Additional Cast Members|Native title|Also Known As):.*$",
+        r"^\s*Remove ads\s*",
+    ]
+]
+
+CREW_ROLE_TEXT_RE = re.compile(
+    r"\b(director|writer|screenwriter|producer|composer|cinematographer|editor|music|crew|staff|art|lighting|original|ost|sound|action|martial)\b"
+)
+CAST_ROLE_TEXT_RE = re.compile(
+    r"\b(main role|main cast|support role|supporting cast|guest role|guest cast|cameo|bit part|voice actor|dubber|dubbing|narrator|special appearance|host|regular member|guest member)\b",
+    re.IGNORECASE,
+)
+MAIN_HEADER_RE = re.compile(r"\b(main|host|regular member)\b")
+GUEST_HEADER_RE = re.compile(r"\b(guest|cameo|bit part|special appearance)\b")
+MAIN_ROLE_RE = re.compile(r"\b(main role|main cast|host|regular member)\b")
+SUPPORT_ROLE_RE = re.compile(r"\b(support role|supporting cast)\b")
+GUEST_ROLE_RE = re.compile(
+    r"\b(guest role|guest cast|cameo|bit part|special appearance|guest member)\b"
+)
+VOICE_ROLE_RE = re.compile(r"\b(voice actor|dubber|dubbing|narrator)\b")
+KNOWN_CREW_ROLE_RE = re.compile(
+    r"\b(director|writer|screenwriter|composer|producer|creator|executive|editor|cinematographer|music|art)\b"
+)
 
 DEBUG_FETCH = os.environ.get("DEBUG_FETCH", "true").lower() == "true"
+NO_HTTP_CACHE = os.environ.get("NO_HTTP_CACHE", "false").lower() == "true"
 
 HAVE_DDGS = False
 try:
@@ -205,6 +329,34 @@ try:
 except:
     HAVE_SCRAPER = False
 
+try:
+    import lxml
+
+    HAVE_LXML = True
+except:
+    HAVE_LXML = False
+
+try:
+    import orjson
+
+    HAVE_ORJSON = True
+except:
+    HAVE_ORJSON = False
+
+try:
+    import python_calamine
+
+    HAVE_CALAMINE = True
+except:
+    HAVE_CALAMINE = False
+
+try:
+    import requests_cache
+
+    HAVE_REQUESTS_CACHE = True
+except:
+    HAVE_REQUESTS_CACHE = False
+
 try:
     from PIL import Image, ImageFile
 
@@ -216,6 +368,7 @@ except:
 try:
     from google.oauth2 import service_account
     from googleapiclient.discovery import build
+    from googleapiclient.errors import HttpError
     from googleapiclient.http import MediaIoBaseDownload
 
     HAVE_GOOGLE_API = True
@@ -224,6 +377,18 @@ except:
 
 IST = timezone(timedelta(hours=5, minutes=30))
 
+# lxml is a C parser and much faster than the pure-Python html.parser.
+HTML_PARSER = "lxml" if HAVE_LXML else "html.parser"
+# AsianWiki and MyDramaList both serve UTF-8. Parsing r.content with the
+# encoding given skips requests' charset detection behind r.text.
+PAGE_ENCODING = "utf-8"
+# calamine (Rust) reads .xlsx several times faster than openpyxl when installed.
+EXCEL_ENGINE = "calamine" if HAVE_CALAMINE else "openpyxl"
+# The MDL /cast page is only walked for headings and cast/crew blocks.
+CAST_PAGE_STRAINER = SoupStrainer(["h2", "h3", "h4", "h5", "li", "div"])
+CAST_ITEM_LEAVES = 'a[href*="/people/"], img, .text-muted, .text-sm, small, .role'
+CAST_ROLE_CLASSES = {"text-muted", "text-sm", "role"}
+
 
 def now_ist():
     return datetime.now(IST)
@@ -292,11 +457,44 @@ BACKUP_META_DIR = "backup-meta-data"
 ARCHIVED_BACKUPS_DIR = "archived-backups"
 ARCHIVED_META_DIR = "archived-backup-meta-data"
 
+# Image paths are built per show/artist in the scrape loops; join the
+# directory once here and only format the ID in.
+SHOW_IMAGE_PATH = os.path.join(SHOW_IMAGES_DIR, "{}.jpg")
+ARTIST_IMAGE_PATH = os.path.join(ARTIST_IMAGES_DIR, "{}.jpg")
+
+JSON_IO_BUFFER = 64 * 1024
+# The workbook download stays in memory up to this size and spills to a temp
+# file beyond it; Drive hands it over in chunks of the same size.
+EXCEL_SPOOL_BYTES = 8 * 1024 * 1024
+
 SERVICE_ACCOUNT_FILE = "GDRIVE_SERVICE_ACCOUNT.json"
 EXCEL_FILE_ID_TXT = "EXCEL_FILE_ID.txt"
+HTTP_CACHE_FILE = "http_cache.sqlite"
+DDGS_CACHE_FILE = "ddgs_cache.sqlite"
+
 
 # ---------------------------- CLOUDSCRAPER ----------------------------
-SCRAPER = cloudscraper.create_scraper() if HAVE_SCRAPER else requests.Session()
+def create_scraper():
+    session_cls = cloudscraper.CloudScraper if HAVE_SCRAPER else requests.Session
+    if not HAVE_REQUESTS_CACHE or NO_HTTP_CACHE:
+        return session_cls()
+
+    # Show pages are cached on disk for a week so reruns skip the network.
+    # Images are excluded; they are written to disk once and never re-read.
+    class CachedScraper(requests_cache.CacheMixin, session_cls):
+        pass
+
+    return CachedScraper(
+        cache_name=HTTP_CACHE_FILE,
+        backend="sqlite",
+        expire_after=timedelta(days=7),
+        allowable_methods=("GET",),
+        stale_if_error=True,
+        filter_fn=lambda r: not r.headers.get("content-type", "").startswith("image"),
+    )
+
+
+SCRAPER = create_scraper()
 SCRAPER.headers.update(
     {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
@@ -304,6 +502,282 @@ SCRAPER.headers.update(
         "Cookie": "lc-main=en_US",
     }
 )
+# Transient gateway errors are retried on the pooled keep-alive connections
+# with backoff. 429 is returned to the caller so remember_failed_url can slow
+# the host's token bucket down, rather than being retried inside one get()
+# past throttle() while a host_slot is held. 503 is left to cloudscraper,
+# which answers Cloudflare challenges with it. The existing adapters are kept
+# since cloudscraper's https adapter carries its TLS cipher setup.
+SCRAPER_RETRY = Retry(
+    total=3,
+    backoff_factor=1.5,
+    status_forcelist=(500, 502, 504),
+    allowed_methods=("GET",),
+    respect_retry_after_header=False,
+    raise_on_status=False,
+)
+for _adapter in SCRAPER.adapters.values():
+    _adapter.max_retries = SCRAPER_RETRY
+
+# ---------------------------- RATE LIMITING ----------------------------
+# Token bucket per host: (sustained requests per second, burst size). A host
+# that has been idle can take a short burst, e.g. a show's page followed by
+# its cast page, before falling back to the sustained rate.
+RATE_LIMITS = {
+    "duckduckgo": (0.5, 2),
+    "mydramalist.com": (0.5, 3),
+    "asianwiki.com": (1.0, 3),
+}
+# SCRAPER_RATE_LIMIT_DELAY, in seconds, replaces every host's sustained rate.
+_delay = float(os.environ.get("SCRAPER_RATE_LIMIT_DELAY") or 0)
+if _delay > 0:
+    RATE_LIMITS = {
+        host: (1.0 / _delay, burst) for host, (_, burst) in RATE_LIMITS.items()
+    }
+# A 403, 429 or 503 halves the host's rate (an unlisted host starts from
+# BACKOFF_START_RATE), never dropping below one request per MAX_BACKOFF_DELAY.
+# The reduced rate lapses BACKOFF_COOLDOWN seconds after the last refusal and
+# the host returns to its configured rate.
+BACKOFF_START_RATE = 2.0
+MAX_BACKOFF_DELAY = 30.0
+BACKOFF_COOLDOWN = 120.0
+# host -> (reduced rate, monotonic time it lapses)
+_BACKOFF = {}
+# When each host's bucket is next completely drained (GCRA arrival time).
+_BUCKET_DRAINED_AT = defaultdict(float)
+_THROTTLE_LOCK = threading.Lock()
+# Caps simultaneous page downloads per host, so a slow site cannot tie up the
+# connections that searches and prefetches of the other sites are waiting on.
+HOST_CONNECTIONS = 3
+_HOST_SLOTS = {}
+# Parallel headshot downloads per show; stays under the session's default
+# connection pool of 10 per host so connections are reused, not discarded.
+ARTIST_IMAGE_WORKERS = 8
+# Threads compressing and writing the queued backup files at the end of a run.
+BACKUP_WRITE_WORKERS = 4
+
+
+def request_host(url):
+    host = urlparse(url).netloc.lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+# Called with _THROTTLE_LOCK held. A backed-off host gets no burst.
+def _host_rate(host, now):
+    backoff = _BACKOFF.get(host)
+    if backoff:
+        if now < backoff[1]:
+            return backoff[0], 1
+        del _BACKOFF[host]
+    return RATE_LIMITS.get(host, (0, 0))
+
+
+def throttle(host):
+    # Reserve this request's start time under the lock, then sleep outside
+    # it so threads waiting on other hosts are not held up.
+    if host not in RATE_LIMITS and host not in _BACKOFF:
+        return
+    with _THROTTLE_LOCK:
+        now = time.monotonic()
+        rate, burst = _host_rate(host, now)
+        if not rate:
+            return
+        interval = 1.0 / rate
+        drained_at = _BUCKET_DRAINED_AT[host]
+        start = max(now, drained_at - (burst - 1) * interval)
+        _BUCKET_DRAINED_AT[host] = max(drained_at, start) + interval
+    if start > now:
+        time.sleep(start - now)
+
+
+def slow_down(host):
+    with _THROTTLE_LOCK:
+        now = time.monotonic()
+        rate = _host_rate(host, now)[0] or BACKOFF_START_RATE
+        rate = max(rate / 2, 1.0 / MAX_BACKOFF_DELAY)
+        _BACKOFF[host] = (rate, now + BACKOFF_COOLDOWN)
+
+
+def host_slot(host):
+    with _THROTTLE_LOCK:
+        slot = _HOST_SLOTS.get(host)
+        if slot is None:
+            slot = _HOST_SLOTS[host] = threading.BoundedSemaphore(HOST_CONNECTIONS)
+    return slot
+
+
+def served_from_cache(url):
+    cache = getattr(SCRAPER, "cache", None)
+    if cache is None:
+        return False
+    try:
+        cached = cache.get_response(cache.create_key(requests.Request("GET", url)))
+    except Exception:
+        return False
+    return cached is not None and not cached.is_expired
+
+
+def fetch_page(url, **kwargs):
+    # A page the HTTP cache answers takes neither a token nor a connection slot.
+    if served_from_cache(url):
+        return SCRAPER.get(url, **kwargs)
+    host = request_host(url)
+    throttle(host)
+    with host_slot(host):
+        return SCRAPER.get(url, **kwargs)
+
+
+# ---------------------------- SEARCH CACHE ----------------------------
+# DDGS results are kept on disk for a week; a hit skips both the query and
+# its throttle wait. Payloads are stored without indentation since only the
+# script reads them.
+DDGS_CACHE_TTL = timedelta(days=7).total_seconds()
+_DDGS_CACHE_LOCK = threading.Lock()
+_DDGS_CACHE_DB = None
+
+
+def _ddgs_cache_db():
+    global _DDGS_CACHE_DB
+    if _DDGS_CACHE_DB is None:
+        _DDGS_CACHE_DB = sqlite3.connect(DDGS_CACHE_FILE, check_same_thread=False)
+        _DDGS_CACHE_DB.execute(
+            "CREATE TABLE IF NOT EXISTS results "
+            "(query TEXT PRIMARY KEY, saved_at REAL, payload BLOB)"
+        )
+    return _DDGS_CACHE_DB
+
+
+def _load_cached_search(query):
+    try:
+        with _DDGS_CACHE_LOCK:
+            row = (
+                _ddgs_cache_db()
+                .execute(
+                    "SELECT saved_at, payload FROM results WHERE query = ?", (query,)
+                )
+                .fetchone()
+            )
+    except sqlite3.Error as e:
+        logd(f"DDGS cache read failed: {e}")
+        return None
+    if row and time.time() - row[0] < DDGS_CACHE_TTL:
+        return decode_json(row[1])
+    return None
+
+
+def _store_cached_search(query, results):
+    try:
+        with _DDGS_CACHE_LOCK:
+            db = _ddgs_cache_db()
+            db.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?)",
+                (query, time.time(), encode_json(results, indent=False)),
+            )
+            db.commit()
+    except sqlite3.Error as e:
+        logd(f"DDGS cache write failed: {e}")
+
+
+# Results already seen this run, so a repeated query skips the sqlite read and
+# JSON decode as well.
+_SEARCH_MEMO = {}
+
+_DDGS_CLIENTS = threading.local()
+
+
+def _ddgs_client():
+    # One client per thread keeps its connection alive across queries instead
+    # of a new TLS handshake for every DDGS() call. Clients are not shared
+    # between threads.
+    client = getattr(_DDGS_CLIENTS, "client", None)
+    if client is None:
+        client = _DDGS_CLIENTS.client = DDGS()
+    return client
+
+
+def search_ddgs(query):
+    if query in _SEARCH_MEMO:
+        return _SEARCH_MEMO[query]
+    if not NO_HTTP_CACHE:
+        results = _load_cached_search(query)
+        if results is not None:
+            _SEARCH_MEMO[query] = results
+            return results
+
+    results = None
+    for attempt in range(3):
+        try:
+            if attempt:
+                time.sleep(attempt * 2.0)
+            throttle("duckduckgo")
+            results = list(_ddgs_client().text(query, max_results=5))
+            break
+        except Exception as e:
+            # ddgs and duckduckgo_search both name it RatelimitException.
+            if type(e).__name__ == "RatelimitException":
+                slow_down("duckduckgo")
+            # Start the retry from a fresh session.
+            _DDGS_CLIENTS.client = None
+
+    # Empty results are not cached; they are often a soft rate-limit response.
+    if results:
+        _SEARCH_MEMO[query] = results
+        if not NO_HTTP_CACHE:
+            _store_cached_search(query, results)
+    return results
+
+
+# Run-wide memo of page lookups. Shows repeat across sheets (e.g. the dubbed
+# sheet), so a lookup already resolved this run goes straight to its page,
+# and URLs that answered 404 or 410 are not requested again. Neither are
+# pages that lacked their site's landmark marker; they were read and rejected.
+_RESOLVED_PAGE_URLS = {}
+_FAILED_URLS = set()
+_UNMARKED_URLS = set()
+# The last few parsed pages by URL. Neighbouring rows are often seasons of one
+# series, whose searches turn up the same candidate pages.
+PAGE_SOUP_CACHE_SIZE = 8
+_PAGE_SOUPS = OrderedDict()
+# Each cached page's <b> tags, found on first use and evicted with its soup.
+_PAGE_LABEL_TAGS = {}
+_PAGE_SOUPS_LOCK = threading.Lock()
+
+
+def remember_failed_url(url, status_code):
+    # Only 404/410 mean the page is gone. Through cloudscraper a 403 is usually
+    # a Cloudflare challenge, so like 429 and 503 it only means slow down.
+    if status_code in (403, 429, 503):
+        slow_down(request_host(url))
+    elif status_code in (404, 410):
+        _FAILED_URLS.add(url)
+
+
+def fetch_page_soup(url, marker=None):
+    # A page whose bytes lack `marker` cannot hold the site's landmark and is
+    # rejected without being parsed.
+    if url in _FAILED_URLS or (marker and url in _UNMARKED_URLS):
+        return None
+    with _PAGE_SOUPS_LOCK:
+        soup = _PAGE_SOUPS.get(url)
+        if soup is not None:
+            _PAGE_SOUPS.move_to_end(url)
+            return soup
+    r = fetch_page(url, timeout=15)
+    if r.status_code != 200:
+        remember_failed_url(url, r.status_code)
+        return None
+    if marker and marker not in r.content:
+        _UNMARKED_URLS.add(url)
+        return None
+    soup = BeautifulSoup(r.content, HTML_PARSER, from_encoding=PAGE_ENCODING)
+    with _PAGE_SOUPS_LOCK:
+        _PAGE_SOUPS[url] = soup
+        _PAGE_LABEL_TAGS.pop(url, None)
+        if len(_PAGE_SOUPS) > PAGE_SOUP_CACHE_SIZE:
+            evicted_url, _ = _PAGE_SOUPS.popitem(last=False)
+            _PAGE_LABEL_TAGS.pop(evicted_url, None)
+    return soup
+
 
 LANG_TO_COUNTRY_MAP = {
     "korean": "South Korea",
@@ -317,35 +791,52 @@ LANG_TO_COUNTRY_MAP = {
 }
 
 
+def decode_json(raw):
+    return orjson.loads(raw) if HAVE_ORJSON else json.loads(raw)
+
+
+def encode_json(data, indent=True):
+    # Files keep the 4-space indent they have always had, so a run only
+    # rewrites the lines whose data changed. orjson cannot indent by four and
+    # is only used for compact payloads such as the search cache.
+    if indent:
+        return json.dumps(data, indent=4, ensure_ascii=False).encode("utf-8")
+    if HAVE_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
 def logd(msg):
     if DEBUG_FETCH:
         print(f"[DEBUG] {msg}")
 
 
-def human_readable_field(field):
-    return FIELD_NAME_MAP.get(field, field)
+# Sheets repeat the same dates and comma lists across many rows, so the
+# string parsing behind ddmmyyyy/normalize_list is memoized.
+@lru_cache(maxsize=8192)
+def _ddmmyyyy_str(text):
+    try:
+        dt = pd.to_datetime(text, errors="coerce")
+        return None if pd.isna(dt) else dt.strftime("%d-%m-%Y")
+    except Exception:
+        return None
 
 
 def ddmmyyyy(val):
     if pd.isna(val):
         return None
-    try:
-        dt = pd.to_datetime(str(val).strip(), errors="coerce")
-        return None if pd.isna(dt) else dt.strftime("%d-%m-%Y")
-    except Exception:
-        return None
+    return _ddmmyyyy_str(str(val).strip())
 
 
-def normalize_list(val):
-    if val is None:
-        return []
-    if isinstance(val, dict):
-        return val
-    if isinstance(val, list):
-        items = val
-    else:
-        items = [p.strip() for p in str(val).split(",") if p.strip()]
+def ddmmyyyy_column(values):
+    # A column Excel stored as real dates arrives as datetime64 and is formatted
+    # in one vectorized pass; text or mixed columns go through ddmmyyyy per cell.
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return [None if pd.isna(v) else v for v in values.dt.strftime("%d-%m-%Y")]
+    return [ddmmyyyy(v) for v in values]
 
+
+def _unique_items(items):
     unique_items = []
     seen = set()
     for item in items:
@@ -355,6 +846,39 @@ def normalize_list(val):
     return unique_items
 
 
+@lru_cache(maxsize=8192)
+def _unique_csv_items(text):
+    # Cached as a tuple; normalize_list hands out a fresh list every call.
+    return tuple(_unique_items([p.strip() for p in text.split(",") if p.strip()]))
+
+
+def normalize_list(val):
+    if val is None:
+        return []
+    if isinstance(val, dict):
+        return val
+    if isinstance(val, list):
+        return _unique_items(val)
+    return list(_unique_csv_items(str(val)))
+
+
+def _normalized_key(val):
+    # normalize_list() for comparisons only: the cached CSV tuple is compared
+    # as is instead of being copied into a fresh list.
+    if val is None:
+        return ()
+    if isinstance(val, dict):
+        return val
+    if isinstance(val, list):
+        return tuple(_unique_items(val))
+    return _unique_csv_items(str(val))
+
+
+def values_differ(old_val, new_val):
+    # Equal raw values normalize equally; only normalize real changes.
+    return old_val != new_val and _normalized_key(old_val) != _normalized_key(new_val)
+
+
 def is_empty_val(v):
     if not v:
         return True
@@ -365,30 +889,14 @@ def is_empty_val(v):
 
 def has_missing_metadata(obj):
     lang = obj.get("nativeLanguage", "").lower()
-    is_asian = lang in [
-        "korean",
-        "chinese",
-        "japanese",
-        "thai",
-        "taiwanese",
-        "filipino",
-    ]
+    is_asian = lang in ASIAN_LANGUAGES
 
     if not is_asian:
         return False
 
-    fields_to_check = [
-        "synopsis",
-        "showImage",
-        "otherNames",
-        "releaseDate",
-        "Duration",
-        "director",
-        "tags",
-        "cast",
-    ]
-    if obj.get("showType") != "Movie":
-        fields_to_check.extend(["airedOn", "network"])
+    fields_to_check = (
+        MOVIE_METADATA_FIELDS if obj.get("showType") == "Movie" else METADATA_FIELDS
+    )
 
     spu = obj.get("sitePriorityUsed", {})
     if not spu:
@@ -405,11 +913,16 @@ def has_missing_metadata(obj):
 
 
 def objects_differ(old, new):
-    excel_fields = set(FIELD_NAME_MAP.keys()) - LOCKED_FIELDS_AFTER_CREATION
-    for k in excel_fields:
-        if normalize_list(old.get(k)) != normalize_list(new.get(k)):
-            return True
-    return False
+    # Excel-owned keys whose normalized values differ, in the row's column
+    # order; an empty list means the objects are equal.
+    # Stored shows carry metadata the row lacks, so the dicts are never equal
+    # as a whole; comparing just the Excel values (map/get run in C) settles
+    # unchanged rows without the per-key walk.
+    if list(map(old.get, _EXCEL_DIFF_KEYS)) == list(map(new.get, _EXCEL_DIFF_KEYS)):
+        return []
+    keys = [k for k in new if k in _EXCEL_DIFF_FIELDS]
+    keys += [k for k in _EXCEL_DIFF_FIELDS if k not in new]
+    return [k for k in keys if values_differ(old.get(k), new.get(k))]
 
 
 def _clean_other_names(names_list):
@@ -432,8 +945,8 @@ def merge_batch_state(context):
     if not os.path.exists(BATCH_STATE_FILE):
         return
     try:
-        with open(BATCH_STATE_FILE, "r", encoding="utf-8") as f:
-            batch_state = json.load(f)
+        with open(BATCH_STATE_FILE, "rb") as f:
+            batch_state = decode_json(f.read())
 
         context["previous_report_data"] = batch_state.get("report_data", {})
         context["previous_files_generated"] = batch_state.get("files_generated", {})
@@ -451,6 +964,10 @@ def merge_batch_state(context):
         logd(f"Failed to load batch state: {e}")
 
 
+def report_entry(obj):
+    return {k: obj.get(k) for k in REPORT_ENTRY_FIELDS}
+
+
 def combine_reports(d1, d2):
     res = {}
     keys = list(d1.keys())
@@ -496,8 +1013,7 @@ def save_batch_state(context, current_run_seconds):
         "first_run_id": context.get("first_run_id"),
         "processed_ids_all_runs": list(context.get("processed_ids_all_runs", set())),
     }
-    with open(BATCH_STATE_FILE, "w", encoding="utf-8") as f:
-        json.dump(state, f, indent=4, ensure_ascii=False)
+    save_json_file(BATCH_STATE_FILE, state)
 
 
 def _validate_page_title(soup, expected_name, expected_year, site, url):
@@ -506,9 +1022,9 @@ def _validate_page_title(soup, expected_name, expected_year, site, url):
 
         # --- NEW: STRICT ACTOR/PROFILE REJECTION ---
         if site == "asianwiki":
-            for b_tag in soup.find_all("b"):
+            for b_tag in label_tags(soup, url):
                 b_text = b_tag.get_text(strip=True).lower()
-                if b_text in ["born:", "birthdate:", "birth name:", "blood type:"]:
+                if b_text in {"born:", "birthdate:", "birth name:", "blood type:"}:
                     logd(
                         f"Title Validation FAILED: Detected Actor Profile ({b_text}) instead of Drama/Movie on page."
                     )
@@ -545,10 +1061,10 @@ def _validate_page_title(soup, expected_name, expected_year, site, url):
                 return False
 
         def extract_season(text):
-            m = re.search(r"\b(?:Season|Part|S)\s*(\d+)\b", text, re.IGNORECASE)
+            m = SEASON_NUMBER_RE.search(text)
             if m:
                 return int(m.group(1))
-            m2 = re.search(r"\s+(\d+)$", re.sub(r"\(\d{4}\)", "", text).strip())
+            m2 = TRAILING_NUMBER_RE.search(YEAR_IN_PARENS_RE.sub("", text).strip())
             if m2 and int(m2.group(1)) < 20:
                 return int(m2.group(1))
             return None
@@ -557,7 +1073,7 @@ def _validate_page_title(soup, expected_name, expected_year, site, url):
         exp_s = extract_season(expected_name)
 
         if page_s is None:
-            m_url = re.search(r"(?:season|part)[-_]*(\d+)", url, re.IGNORECASE)
+            m_url = URL_SEASON_RE.search(url)
             if m_url:
                 page_s = int(m_url.group(1))
 
@@ -570,28 +1086,19 @@ def _validate_page_title(soup, expected_name, expected_year, site, url):
             return False
 
         if exp_s > 1 and page_s is None:
-            base_expected = (
-                re.sub(
-                    r"\b(?:Season|Part|S)\s*\d+\b|\s+\d+$",
-                    "",
-                    expected_name,
-                    flags=re.IGNORECASE,
-                )
-                .strip()
-                .lower()
-            )
-            base_page = re.sub(r"\(.*?\)", "", page_title).lower().strip()
+            base_expected = SEASON_SUFFIX_RE.sub("", expected_name).strip().lower()
+            base_page = PARENTHESIZED_RE.sub("", page_title).lower().strip()
             if base_expected in base_page or base_page in base_expected:
                 logd(
                     f"Title Validation FAILED: Expected S{exp_s}, but found base S1 ('{page_title}')"
                 )
                 return False
 
-        t1 = re.sub(r"\(\d{4}\)", "", page_title).lower().strip()
-        t2 = re.sub(r"\(\d{4}\)", "", expected_name).lower().strip()
+        t1 = YEAR_IN_PARENS_RE.sub("", page_title).lower().strip()
+        t2 = YEAR_IN_PARENS_RE.sub("", expected_name).lower().strip()
 
-        t1_core = re.sub(r"\b(?:season|part|s)\s*\d+\b|\s+\d+$", "", t1).strip()
-        t2_core = re.sub(r"\b(?:season|part|s)\s*\d+\b|\s+\d+$", "", t2).strip()
+        t1_core = SEASON_SUFFIX_RE.sub("", t1).strip()
+        t2_core = SEASON_SUFFIX_RE.sub("", t2).strip()
 
         ratio = SequenceMatcher(None, t1_core, t2_core).ratio()
 
@@ -601,7 +1108,7 @@ def _validate_page_title(soup, expected_name, expected_year, site, url):
 
             # Look exclusively in the "Also Known As" / "Romaji" / "Native Title" sections
             if site == "asianwiki":
-                for b_tag in soup.find_all("b"):
+                for b_tag in label_tags(soup, url):
                     b_text = b_tag.get_text(strip=True).lower()
                     if any(
                         kw in b_text
@@ -622,15 +1129,10 @@ def _validate_page_title(soup, expected_name, expected_year, site, url):
                                 .strip()
                             )
                             if val:
-                                aliases.extend(re.split(r"[/,]", val))
+                                aliases.extend(ALIAS_SPLIT_RE.split(val))
                                 break
             elif site == "mydramalist":
-                for b_tag in soup.find_all(
-                    "b",
-                    string=re.compile(
-                        r"^\s*(Also Known As|Native Title).*", re.IGNORECASE
-                    ),
-                ):
+                for b_tag in find_labels(soup, MDL_ALIAS_LABEL_RE, url):
                     for parent in b_tag.find_parents(["li", "div", "p"]):
                         full_text = parent.get_text(" ", strip=True)
                         val = (
@@ -643,7 +1145,7 @@ def _validate_page_title(soup, expected_name, expected_year, site, url):
                             break
 
             clean_aliases = [
-                re.sub(r"\(\d{4}\)", "", a).lower().strip()
+                YEAR_IN_PARENS_RE.sub("", a).lower().strip()
                 for a in aliases
                 if a.strip()
             ]
@@ -670,16 +1172,23 @@ def _validate_page_title(soup, expected_name, expected_year, site, url):
         return True
 
 
-def _scrape_country(soup, site):
+# Element that proves a fetched page is a real show page on each site.
+SITE_LANDMARKS = {
+    "asianwiki": lambda soup: soup.find(id="Profile"),
+    "mydramalist": lambda soup: soup.find("div", class_="box-body"),
+}
+# Raw text each landmark needs, checked on the response bytes before parsing.
+SITE_LANDMARK_MARKERS = {"asianwiki": b"Profile", "mydramalist": b"box-body"}
+
+
+def _scrape_country(soup, site, url):
+    # Both sites render the country as "<b>Country:</b> value".
+    if site not in SITE_LANDMARKS:
+        return None
     try:
-        if site == "asianwiki":
-            tag = soup.find("b", string="Country:")
-            if tag and tag.parent:
-                return tag.parent.get_text(strip=True).replace("Country:", "").strip()
-        elif site == "mydramalist":
-            tag = soup.find("b", string="Country:")
-            if tag and tag.parent:
-                return tag.parent.get_text(strip=True).replace("Country:", "").strip()
+        tag = next(find_labels(soup, "Country:", url), None)
+        if tag and tag.parent:
+            return tag.parent.get_text(strip=True).replace("Country:", "").strip()
     except Exception:
         pass
     return None
@@ -688,20 +1197,35 @@ def _scrape_country(soup, site):
 def get_soup_from_search(
     search_term, expected_name, show_year, site, language, show_type, soup_cache
 ):
-    cache_key = (
-        f"{expected_name}_{search_term}_{show_year}_{site}_{language}_{show_type}"
-    )
+    # A tuple, not a joined string: titles with "_" in them cannot collide,
+    # and no string is built for every lookup.
+    cache_key = (expected_name, search_term, show_year, site, language, show_type)
     if cache_key in soup_cache:
         return soup_cache[cache_key]
 
+    if cache_key in _RESOLVED_PAGE_URLS:
+        url = _RESOLVED_PAGE_URLS[cache_key]
+        soup = None
+        if url:
+            try:
+                soup = fetch_page_soup(url)
+            except Exception:
+                pass
+        # A page that has since disappeared falls through to a fresh search.
+        if soup is not None or not url:
+            soup_cache[cache_key] = (soup, url)
+            return soup, url
+
     expected_country = LANG_TO_COUNTRY_MAP.get(language.lower())
-    clean_name = re.sub(
-        r"\b(?:Season|Part|S)\s*\d+\b|\s+\d+$", "", search_term, flags=re.IGNORECASE
-    ).strip()
+    clean_name = SEASON_SUFFIX_RE.sub("", search_term).strip()
 
     if not HAVE_DDGS:
         return None, None
 
+    find_landmark = SITE_LANDMARKS.get(site)
+    if not find_landmark:
+        return None, None
+
     search_queries = [
         f'"{search_term}" {show_year} {language} site:{site}.com',
         f'"{search_term}" {show_year} site:{site}.com',
@@ -716,129 +1240,159 @@ def get_soup_from_search(
             ]
         )
 
+    # The query variants mostly return the same URLs; each is checked once.
+    tried_urls = set()
+    # A miss is only remembered for the run when every query answered and
+    # every candidate page was read and rejected on its content; empty
+    # results and failed fetches are often a soft rate limit.
+    conclusive = True
     for query in search_queries:
-        results = None
-        for attempt in range(3):
-            try:
-                time.sleep(2.0 + attempt * 2.0)
-                results = list(DDGS().text(query, max_results=5))
-                break
-            except Exception:
-                pass
-
+        results = search_ddgs(query)
         if not results:
+            conclusive = False
             continue
 
         for res in results:
             url = res.get("href", "")
 
             # --- NEW: STRICT URL BLOCKING ---
-            bad_url_keywords = [
-                "/reviews",
-                "/recs",
-                "?lang=",
-                "/photos",
-                "/video",
-                "/trivia",
-                "/people/",
-                "/article/",
-                "/list/",
-                "/cast",
-                "/episodes",
-            ]
-            if (
-                not url
-                or "bing.com" in url
-                or any(bad in url.lower() for bad in bad_url_keywords)
-            ):
+            if not url or "bing.com" in url or BAD_RESULT_URL_RE.search(url):
                 continue
 
-            if site == "asianwiki":
-                url_lower = url.lower()
-                if (
-                    "category:" in url_lower
-                    or "file:" in url_lower
-                    or "/index.php" in url_lower
-                ):
-                    continue
+            if site == "asianwiki" and ASIANWIKI_NON_ARTICLE_RE.search(url):
+                continue
+
+            if url in tried_urls:
+                continue
+            tried_urls.add(url)
 
             try:
-                r = SCRAPER.get(url, timeout=15)
-                if r.status_code == 200:
-                    soup = BeautifulSoup(r.text, "html.parser")
-
-                    is_valid_landmark = False
-                    if site == "asianwiki" and soup.find(id="Profile"):
-                        is_valid_landmark = True
-                    elif site == "mydramalist" and soup.find("div", class_="box-body"):
-                        is_valid_landmark = True
-
-                    if is_valid_landmark:
-                        if expected_country:
-                            scraped_country = _scrape_country(soup, site)
-                            if (
-                                scraped_country
-                                and expected_country not in scraped_country
-                            ):
-                                continue
-
-                        if not _validate_page_title(
-                            soup, expected_name, show_year, site, url
-                        ):
+                soup = fetch_page_soup(url, SITE_LANDMARK_MARKERS.get(site))
+                if soup is None and not (url in _FAILED_URLS or url in _UNMARKED_URLS):
+                    conclusive = False
+                if soup is not None and find_landmark(soup):
+                    if expected_country:
+                        scraped_country = _scrape_country(soup, site, url)
+                        if scraped_country and expected_country not in scraped_country:
                             continue
 
-                        soup_cache[cache_key] = (soup, url)
-                        return soup, url
+                    if not _validate_page_title(
+                        soup, expected_name, show_year, site, url
+                    ):
+                        continue
+
+                    soup_cache[cache_key] = (soup, url)
+                    _RESOLVED_PAGE_URLS[cache_key] = url
+                    return soup, url
             except Exception:
-                pass
+                conclusive = False
 
     soup_cache[cache_key] = (None, None)
+    if conclusive:
+        _RESOLVED_PAGE_URLS[cache_key] = None
     return None, None
 
 
+# Placeholder artwork the sites serve when a show or artist has no picture.
+DUMMY_IMAGE_KEYWORDS = (
+    "default",
+    "nopicture",
+    "no-poster",
+    "avatar",
+    "blank",
+    "null",
+    "data:image",
+)
+# Posters and headshots are well under this; anything larger is not a real one.
+MAX_IMAGE_BYTES = 5 * 1024 * 1024
+
+
 def download_and_save_image(url, local_path, is_artist=False):
     if not HAVE_PIL or not url:
         return False
 
-    dummy_keywords = [
-        "default",
-        "nopicture",
-        "no-poster",
-        "avatar",
-        "blank",
-        "null",
-        "data:image",
-    ]
-    if any(kw in url.lower() for kw in dummy_keywords):
+    if any(kw in url.lower() for kw in DUMMY_IMAGE_KEYWORDS):
         return False
 
-    os.makedirs(os.path.dirname(local_path), exist_ok=True)
     try:
-        url = re.sub(r"_[24]c\.jpg$", ".jpg", url) if not is_artist else url
-        r = SCRAPER.get(url, stream=True, timeout=20)
+        url = IMAGE_SIZE_SUFFIX_RE.sub(".jpg", url) if not is_artist else url
+        if url in _FAILED_URLS:
+            return False
+        throttle(request_host(url))
+        # Streamed so the headers can be checked before the body is read; the
+        # with block hands the connection back to the pool either way.
+        with SCRAPER.get(url, timeout=20, stream=True) as r:
+            remember_failed_url(url, r.status_code)
+            r.raise_for_status()
+            if not r.headers.get("content-type", "").startswith("image"):
+                return False
+            if int(r.headers.get("content-length") or 0) > MAX_IMAGE_BYTES:
+                return False
+            # r.content is already de-chunked and decompressed, unlike r.raw.
+            data = r.content
 
-        if r.status_code == 200 and r.headers.get("content-type", "").startswith(
-            "image"
-        ):
-            with Image.open(r.raw) as img:
-                img = img.convert("RGB")
-                size = (400, 600) if is_artist else (800, 1200)
-                img.thumbnail(size, Image.LANCZOS)
-                img.save(local_path, "JPEG", quality=90)
+        with Image.open(io.BytesIO(data)) as img:
+            size = (400, 600) if is_artist else (800, 1200)
+            # A colour JPEG that already fits is written out byte for byte;
+            # only the header has been read, so it is never decoded.
+            if (
+                img.format == "JPEG"
+                and img.mode == "RGB"
+                and img.width <= size[0]
+                and img.height <= size[1]
+            ):
+                with open(local_path, "wb") as f:
+                    f.write(data)
                 return True
+            # Let libjpeg decode large JPEGs at a reduced DCT scale; keeping
+            # 2x the target size leaves LANCZOS enough pixels for a clean resize.
+            img.draft("RGB", (size[0] * 2, size[1] * 2))
+            img = img.convert("RGB")
+            # Already-small images are saved as is, and a mild downscale looks
+            # the same with BILINEAR; LANCZOS is kept for the big reductions.
+            scale = max(img.width / size[0], img.height / size[1])
+            if scale > 1:
+                img.thumbnail(size, Image.BILINEAR if scale < 1.5 else Image.LANCZOS)
+            img.save(local_path, "JPEG", quality=90, optimize=True, progressive=True)
+            return True
     except Exception as e:
         logd(f"Failed to download image from {url}: {e}")
     return False
 
 
-def _extract_mdl_list_item(soup, label_regex):
-    b_tag = soup.find("b", string=re.compile(label_regex, re.IGNORECASE))
+# Every "<b>Label:</b> value" lookup on a page shares one walk of the tree;
+# matching the labels themselves is then only a pass over the <b> tags.
+# Only soups held in _PAGE_SOUPS under `url` keep their tag list; any other
+# soup (e.g. a cast page) is walked on each call.
+def label_tags(soup, url=None):
+    with _PAGE_SOUPS_LOCK:
+        b_tags = _PAGE_LABEL_TAGS.get(url)
+    if b_tags is not None:
+        return b_tags
+    b_tags = soup.find_all("b")
+    with _PAGE_SOUPS_LOCK:
+        if _PAGE_SOUPS.get(url) is soup:
+            _PAGE_LABEL_TAGS[url] = b_tags
+    return b_tags
+
+
+def find_labels(soup, label, url=None):
+    return (
+        b
+        for b in label_tags(soup, url)
+        if b.string is not None
+        and (label.search(b.string) if hasattr(label, "search") else b.string == label)
+    )
+
+
+def _extract_mdl_list_item(soup, label_re, url=None):
+    b_tag = next(find_labels(soup, label_re, url), None)
     if b_tag:
         for parent_tag in b_tag.find_parents(["li", "div", "p"]):
             full_text = parent_tag.get_text(" ", strip=True)
             b_text = b_tag.get_text(" ", strip=True)
             text = full_text.replace(b_text, "").strip()
-            text = re.sub(r"^[:\s]+", "", text).strip()
+            text = LEADING_COLON_RE.sub("", text).strip()
             if text:
                 return text, parent_tag
     return None, None
@@ -847,39 +1401,37 @@ def _extract_mdl_list_item(soup, label_regex):
 # --- ASIANWIKI SCRAPERS ---
 def _scrape_synopsis_from_asianwiki(soup, **kwargs):
     try:
-        target_element = soup.find(id=re.compile(r"(Plot|Synopsis)", re.IGNORECASE))
+        target_element = soup.find(id=PLOT_HEADING_RE)
         if not target_element:
             for tag in soup.find_all(["h2", "h3", "h4", "b", "strong"]):
-                if re.search(
-                    r"^(Plot|Synopsis)", tag.get_text(strip=True), re.IGNORECASE
-                ):
+                if PLOT_HEADING_START_RE.search(tag.get_text(strip=True)):
                     target_element = tag
                     break
 
         if not target_element:
             return None
-        if target_element.name not in ["h2", "h3"]:
+        if target_element.name not in {"h2", "h3"}:
             parent = target_element.find_parent(["h2", "h3"])
             if parent:
                 target_element = parent
 
         content = []
         for sibling in target_element.next_siblings:
-            if getattr(sibling, "name", None) in ["h2", "h3", "h4"]:
+            if getattr(sibling, "name", None) in {"h2", "h3", "h4"}:
                 break
             text = (
                 sibling.get_text(strip=True)
                 if hasattr(sibling, "get_text")
                 else str(sibling).strip()
             )
-            if getattr(sibling, "name", None) in ["script", "style", "table"]:
+            if getattr(sibling, "name", None) in {"script", "style", "table"}:
                 continue
             if text and len(text) >= 3:
                 content.append(text)
 
         synopsis = "\n\n".join(content) if content else None
         if synopsis:
-            synopsis = re.sub(r"[\s\(\-\[\]\,]+$", "", synopsis).strip()
+            synopsis = TRAILING_JUNK_RE.sub("", synopsis).strip()
         return synopsis
     except Exception:
         return None
@@ -894,11 +1446,19 @@ def _scrape_image_from_asianwiki(soup, **kwargs):
                 "a.image > img[src], .infobox img[src], .thumbinner img[src]"
             )
             if img:
-                url = requests.compat.urljoin("https://asianwiki.com", img["src"])
+                # src is absolute, protocol-relative or site-rooted; no need
+                # to run it through a full URL parser.
+                src = img["src"]
+                if src.startswith("//"):
+                    url = f"https:{src}"
+                elif src.startswith(("http://", "https://")):
+                    url = src
+                else:
+                    url = f"https://asianwiki.com/{src.lstrip('/')}"
 
         if not url:
             return None
-        image_path = os.path.join(SHOW_IMAGES_DIR, f"{kwargs['sid']}.jpg")
+        image_path = SHOW_IMAGE_PATH.format(kwargs["sid"])
         if download_and_save_image(url, image_path):
             return os.path.basename(image_path)
     except Exception:
@@ -914,20 +1474,10 @@ def _scrape_synopsis_from_mydramalist(soup, **kwargs):
         text = synopsis_div.get_text(separator="\n", strip=True)
         paragraphs = [line.strip() for line in text.split("\n") if line.strip()]
         synopsis = "\n\n".join(paragraphs)
-        patterns_to_remove = [
-            r"\s*\(Source:.*?\)\s*$",
-            r"\s*Source:.*$",
-            r"~~.*",
-            r"\s*Edit Translation\s*$",
-            r"\s*(Additional Cast Members|Native title|Also Known As):.*$",
-            r"^\s*Remove ads\s*",
-        ]
-        for pattern in patterns_to_remove:
-            synopsis = re.sub(
-                pattern, "", synopsis, flags=re.IGNORECASE | re.DOTALL
-            ).strip()
+        for pattern in MDL_SYNOPSIS_JUNK_RES:
+            synopsis = pattern.sub("", synopsis).strip()
         if synopsis:
-            synopsis = re.sub(r"[\s\(\-\[\]\,]+$", "", synopsis).strip()
+            synopsis = TRAILING_JUNK_RE.sub("", synopsis).strip()
         return synopsis if synopsis else None
     except Exception as e:
         return None
@@ -943,7 +1493,7 @@ def _scrape_image_from_mydramalist(soup, **kwargs):
                 url = img.get("src") or img.get("data-src") or img.get("data-original")
         if not url:
             return None
-        image_path = os.path.join(SHOW_IMAGES_DIR, f"{kwargs['sid']}.jpg")
+        image_path = SHOW_IMAGE_PATH.format(kwargs["sid"])
         if download_and_save_image(url, image_path):
             return os.path.basename(image_path)
     except Exception:
@@ -952,7 +1502,7 @@ def _scrape_image_from_mydramalist(soup, **kwargs):
 
 def _scrape_othernames_from_mydramalist(soup, **kwargs):
     try:
-        text, _ = _extract_mdl_list_item(soup, r"^\s*Also Known As.*")
+        text, _ = _extract_mdl_list_item(soup, MDL_AKA_LABEL_RE, kwargs.get("url"))
         if text:
             raw_names = [name.strip() for name in text.split(",") if name.strip()]
             filtered = [
@@ -968,7 +1518,7 @@ def _scrape_othernames_from_mydramalist(soup, **kwargs):
 
 def _scrape_duration_from_mydramalist(soup, **kwargs):
     try:
-        text, _ = _extract_mdl_list_item(soup, r"^\s*Duration.*")
+        text, _ = _extract_mdl_list_item(soup, MDL_DURATION_LABEL_RE, kwargs.get("url"))
         if text:
             return text.replace(" min.", " mins") if "hr" not in text else text
     except Exception:
@@ -978,7 +1528,7 @@ def _scrape_duration_from_mydramalist(soup, **kwargs):
 
 def _scrape_release_date_from_mydramalist(soup, **kwargs):
     try:
-        text, _ = _extract_mdl_list_item(soup, r"^\s*Aired[\s:]*$")
+        text, _ = _extract_mdl_list_item(soup, MDL_AIRED_LABEL_RE, kwargs.get("url"))
         if text:
             return text
     except Exception:
@@ -988,7 +1538,7 @@ def _scrape_release_date_from_mydramalist(soup, **kwargs):
 
 def _scrape_director_from_mydramalist(soup, **kwargs):
     try:
-        text, _ = _extract_mdl_list_item(soup, r"^\s*Director.*")
+        text, _ = _extract_mdl_list_item(soup, MDL_DIRECTOR_LABEL_RE, kwargs.get("url"))
         if text:
             return [name.strip() for name in text.split(",") if name.strip()]
     except Exception:
@@ -1011,7 +1561,9 @@ def _scrape_tags_from_mydramalist(soup, **kwargs):
 
 def _scrape_network_from_mydramalist(soup, **kwargs):
     try:
-        text, parent_tag = _extract_mdl_list_item(soup, r"^\s*Original Network.*")
+        text, parent_tag = _extract_mdl_list_item(
+            soup, MDL_NETWORK_LABEL_RE, kwargs.get("url")
+        )
         if parent_tag:
             nets = [a.get_text(strip=True) for a in parent_tag.find_all("a")]
             if nets:
@@ -1024,7 +1576,7 @@ def _scrape_network_from_mydramalist(soup, **kwargs):
 
 def _scrape_airedon_from_mydramalist(soup, **kwargs):
     try:
-        text, _ = _extract_mdl_list_item(soup, r"^\s*Aired On.*")
+        text, _ = _extract_mdl_list_item(soup, MDL_AIRED_ON_LABEL_RE, kwargs.get("url"))
         if text:
             return [day.strip() for day in text.split(",") if day.strip()]
     except Exception:
@@ -1043,14 +1595,19 @@ def _scrape_cast_from_mydramalist(soup, **kwargs):
             base_url = url.split("#")[0].split("?")[0].rstrip("/")
             cast_url = base_url if base_url.endswith("/cast") else base_url + "/cast"
             try:
-                time.sleep(4.0)
                 headers = {
                     "Referer": url,
                     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
                 }
-                r = SCRAPER.get(cast_url, headers=headers, timeout=20)
-                if r.status_code == 200 and "/people/" in r.text:
-                    cast_soup = BeautifulSoup(r.text, "html.parser")
+                r = fetch_page(cast_url, headers=headers, timeout=20)
+                remember_failed_url(cast_url, r.status_code)
+                if r.status_code == 200 and b"/people/" in r.content:
+                    cast_soup = BeautifulSoup(
+                        r.content,
+                        HTML_PARSER,
+                        from_encoding=PAGE_ENCODING,
+                        parse_only=CAST_PAGE_STRAINER,
+                    )
                     if cast_soup.select('a[href*="/people/"]'):
                         target_soup = cast_soup
             except Exception as e:
@@ -1063,7 +1620,7 @@ def _scrape_cast_from_mydramalist(soup, **kwargs):
             for a in target_soup.select('a[href*="/people/"]'):
                 parent = a.find_parent(
                     ["li", "div"],
-                    class_=re.compile(r"\b(list-item|col-(?:sm|md|lg)-\d+|row)\b"),
+                    class_=CAST_ITEM_CLASS_RE,
                 )
                 if parent and parent not in items:
                     items.append(parent)
@@ -1114,8 +1671,21 @@ def _scrape_cast_from_mydramalist(soup, **kwargs):
         main_role_count = 0
         for item in items:
             try:
+                # One walk over the item collects the people links, the poster
+                # and the role labels instead of a separate select per kind.
+                people_links, role_elements, img_tag = [], [], None
+                for el in item.select(CAST_ITEM_LEAVES):
+                    if el.name == "a" and "/people/" in el.get("href", ""):
+                        people_links.append(el)
+                    if el.name == "img" and img_tag is None:
+                        img_tag = el
+                    if el.name == "small" or CAST_ROLE_CLASSES.intersection(
+                        el.get("class", [])
+                    ):
+                        role_elements.append(el)
+
                 artist_name, artist_link = None, None
-                for a in item.select('a[href*="/people/"]'):
+                for a in people_links:
                     text = a.get_text(strip=True)
                     if text:
                         artist_name = text
@@ -1124,7 +1694,7 @@ def _scrape_cast_from_mydramalist(soup, **kwargs):
 
                 if not artist_name:
                     continue
-                id_match = re.search(r"/people/(\d+)", artist_link)
+                id_match = PEOPLE_ID_RE.search(artist_link)
                 if not id_match:
                     continue
                 artist_id = id_match.group(1)
@@ -1133,7 +1703,6 @@ def _scrape_cast_from_mydramalist(soup, **kwargs):
                     continue
                 seen_ids.add(artist_id)
 
-                img_tag = item.select_one("img")
                 artist_image_url = (
                     img_tag.get("src")
                     or img_tag.get("data-src")
@@ -1147,7 +1716,7 @@ def _scrape_cast_from_mydramalist(soup, **kwargs):
                     artist_image_url = None
 
                 role_texts = []
-                elements = list(item.select(".text-muted, .text-sm, small, .role"))
+                elements = role_elements
                 nxt = item.find_next_sibling("div")
                 if nxt and any(
                     "col" in str(c).lower()
@@ -1194,15 +1763,9 @@ def _scrape_cast_from_mydramalist(soup, **kwargs):
                     is_crew = True
 
                 combined_text = " ".join(role_texts).lower()
-                if re.search(
-                    r"\b(director|writer|screenwriter|producer|composer|cinematographer|editor|music|crew|staff|art|lighting|original|ost|sound|action|martial)\b",
-                    combined_text,
-                ):
+                if CREW_ROLE_TEXT_RE.search(combined_text):
                     is_crew = True
-                if re.search(
-                    r"\b(main role|main cast|support role|supporting cast|guest role|guest cast|cameo|bit part|voice actor|dubber|dubbing|narrator|special appearance|host|regular member|guest member)\b",
-                    combined_text,
-                ):
+                if CAST_ROLE_TEXT_RE.search(combined_text):
                     is_crew = False
 
                 if is_crew:
@@ -1212,58 +1775,37 @@ def _scrape_cast_from_mydramalist(soup, **kwargs):
                         not final_role
                         and raw_header_text
                         and header_text
-                        not in ["cast", "crew", "cast & crew", "cast and crew"]
+                        not in {"cast", "crew", "cast & crew", "cast and crew"}
                     ):
                         final_role = raw_header_text
                     if not final_role:
                         final_role = "Crew"
-                    final_role = (
-                        re.sub(r"^[,:\-\s]+|[,:\-\s]+$", "", final_role).strip().title()
-                    )
+                    final_role = EDGE_PUNCT_RE.sub("", final_role).strip().title()
                     if len(final_role) > 50:
                         final_role = final_role[:50]
                 else:
                     character_name = "Unknown"
                     final_role = "Support Role"
                     if not role_texts and raw_header_text:
-                        if re.search(r"\b(main|host|regular member)\b", header_text):
+                        if MAIN_HEADER_RE.search(header_text):
                             final_role = "Main Role"
-                        elif re.search(
-                            r"\b(guest|cameo|bit part|special appearance)\b",
-                            header_text,
-                        ):
+                        elif GUEST_HEADER_RE.search(header_text):
                             final_role = "Guest Role"
 
                     for txt in role_texts:
                         txt_lower = txt.lower()
 
-                        if re.search(
-                            r"\b(main role|main cast|host|regular member)\b", txt_lower
-                        ):
+                        if MAIN_ROLE_RE.search(txt_lower):
                             final_role = "Main Role"
-                        elif re.search(
-                            r"\b(support role|supporting cast)\b", txt_lower
-                        ):
+                        elif SUPPORT_ROLE_RE.search(txt_lower):
                             final_role = "Support Role"
-                        elif re.search(
-                            r"\b(guest role|guest cast|cameo|bit part|special appearance|guest member)\b",
-                            txt_lower,
-                        ):
+                        elif GUEST_ROLE_RE.search(txt_lower):
                             final_role = "Guest Role"
-                        elif re.search(
-                            r"\b(voice actor|dubber|dubbing|narrator)\b", txt_lower
-                        ):
+                        elif VOICE_ROLE_RE.search(txt_lower):
                             final_role = "Voice Actor"
 
-                        clean_char = re.sub(
-                            r"\b(main role|main cast|support role|supporting cast|guest role|guest cast|cameo|bit part|voice actor|dubber|dubbing|narrator|special appearance|host|regular member|guest member)\b",
-                            "",
-                            txt,
-                            flags=re.IGNORECASE,
-                        )
-                        clean_char = re.sub(
-                            r"^[,:\-\s]+|[,:\-\s]+$", "", clean_char
-                        ).strip()
+                        clean_char = CAST_ROLE_TEXT_RE.sub("", txt)
+                        clean_char = EDGE_PUNCT_RE.sub("", clean_char).strip()
                         if clean_char and clean_char.lower() not in [
                             "role",
                             "cast",
@@ -1313,19 +1855,23 @@ def _scrape_cast_from_mydramalist(soup, **kwargs):
 
 
 # --- NEW: CLEANED UP SCRAPE MAP ---
+def _scrape_disabled(**kwargs):
+    return None
+
+
 SCRAPE_MAP = {
     "asianwiki": {
         "synopsis": _scrape_synopsis_from_asianwiki,
         "showImage": _scrape_image_from_asianwiki,
         # Completely disabled unused Asianwiki scraping features to prevent overrides
-        "otherNames": lambda **kwargs: None,
-        "Duration": lambda **kwargs: None,
-        "releaseDate": lambda **kwargs: None,
-        "director": lambda **kwargs: None,
-        "tags": lambda **kwargs: None,
-        "cast": lambda **kwargs: None,
-        "network": lambda **kwargs: None,
-        "airedOn": lambda **kwargs: None,
+        "otherNames": _scrape_disabled,
+        "Duration": _scrape_disabled,
+        "releaseDate": _scrape_disabled,
+        "director": _scrape_disabled,
+        "tags": _scrape_disabled,
+        "cast": _scrape_disabled,
+        "network": _scrape_disabled,
+        "airedOn": _scrape_disabled,
     },
     "mydramalist": {
         "synopsis": _scrape_synopsis_from_mydramalist,
@@ -1347,6 +1893,74 @@ FALLBACK_ORDER = {
 }
 
 
+@lru_cache(maxsize=None)
+def fetch_plan(lang, show_type):
+    # Per language and show type: each field with its (site, scraper, label)
+    # steps in fallback order. Disabled scrapers are left out so their site is
+    # never searched just to return nothing.
+    priority = SITE_PRIORITY_BY_LANGUAGE.get(lang, SITE_PRIORITY_BY_LANGUAGE["default"])
+    plan = []
+    for field in MOVIE_METADATA_FIELDS if show_type == "Movie" else METADATA_FIELDS:
+        initial_site = priority.get(field)
+        if not initial_site:
+            continue
+        steps = tuple(
+            (
+                site,
+                SCRAPE_MAP[site][field],
+                (
+                    site
+                    if site == initial_site
+                    else f"{initial_site} (Fallback: {site})"
+                ),
+            )
+            for site in FALLBACK_ORDER.get(initial_site, [initial_site])
+            if SCRAPE_MAP[site][field] is not _scrape_disabled
+        )
+        plan.append((field, steps))
+    return tuple(plan)
+
+
+# Speculative page searches for upcoming shows, bounded to go easy on the origins.
+# The per-host throttle still paces the requests; the pool only overlaps waits.
+PREFETCH_AHEAD = 4
+_PREFETCH_POOL = ThreadPoolExecutor(max_workers=PREFETCH_AHEAD)
+# Searches and field scrapes within one show. Long-lived like the prefetch
+# pool, so each worker keeps its DDGS client and connections across shows;
+# sized for one task per field of the longest fetch plan.
+SHOW_FETCH_WORKERS = 10
+_SHOW_FETCH_POOL = ThreadPoolExecutor(max_workers=SHOW_FETCH_WORKERS)
+
+
+def show_search_terms(show_name):
+    return list(dict.fromkeys([show_name, SEASON_SUFFIX_RE.sub("", show_name).strip()]))
+
+
+def prefetch_show_pages(obj):
+    soup_cache = {}
+    lang = obj.get("nativeLanguage", "")
+    if lang.lower() not in ASIAN_LANGUAGES:
+        return soup_cache
+    plan = fetch_plan(lang.lower(), obj.get("showType", "Drama"))
+    try:
+        for site in dict.fromkeys(steps[0][0] for _, steps in plan if steps):
+            for term in show_search_terms(obj["showName"]):
+                soup, _ = get_soup_from_search(
+                    term,
+                    obj["showName"],
+                    obj["releasedYear"],
+                    site,
+                    lang,
+                    obj.get("showType", "Drama"),
+                    soup_cache,
+                )
+                if soup:
+                    break
+    except Exception as e:
+        logd(f"Prefetch failed for {obj.get('showID')}: {e}")
+    return soup_cache
+
+
 def fetch_and_populate_metadata(obj, context, artists_db):
     s_id, s_name, s_year, lang = (
         obj["showID"],
@@ -1354,167 +1968,172 @@ def fetch_and_populate_metadata(obj, context, artists_db):
         obj["releasedYear"],
         obj.get("nativeLanguage", ""),
     )
-    priority = SITE_PRIORITY_BY_LANGUAGE.get(
-        lang.lower(), SITE_PRIORITY_BY_LANGUAGE["default"]
-    )
     spu = obj.setdefault("sitePriorityUsed", {})
     show_type = obj.get("showType", "Drama")
 
-    is_asian = lang.lower() in [
-        "korean",
-        "chinese",
-        "japanese",
-        "thai",
-        "taiwanese",
-        "filipino",
-    ]
+    is_asian = lang.lower() in ASIAN_LANGUAGES
 
     if not is_asian:
         return obj
 
     context["source_links_temp"] = {}
-    soup_cache = {}
-    fields_to_check = [
-        "synopsis",
-        "showImage",
-        "otherNames",
-        "releaseDate",
-        "Duration",
-        "director",
-        "tags",
-        "cast",
-        "network",
-        "airedOn",
-    ]
-
-    for field in fields_to_check:
-        if show_type == "Movie" and field in ["airedOn", "network"]:
-            continue
-
+    prefetched = context.get("prefetched", {}).pop(s_id, None)
+    soup_cache = prefetched.result() if prefetched else {}
+    pending = []
+    for field, steps in fetch_plan(lang.lower(), show_type):
         if spu.get(field) == "Manual":
             continue
 
-        val = obj.get(field)
-        is_empty = is_empty_val(val)
-        should_fetch = is_empty or field == "network"
+        is_empty = is_empty_val(obj.get(field))
+        if is_empty or field == "network":
+            pending.append((field, steps, is_empty))
 
-        if should_fetch:
-            initial_site = priority.get(field)
-            if not initial_site:
-                continue
+    search_terms = show_search_terms(s_name)
 
-            sites_to_try = FALLBACK_ORDER.get(initial_site, [initial_site])
-            fetched_successfully = False
-
-            for current_site in sites_to_try:
-                search_terms = [
-                    s_name,
-                    re.sub(
-                        r"\b(?:Season|Part|S)\s*\d+\b|\s+\d+$",
-                        "",
-                        s_name,
-                        flags=re.IGNORECASE,
-                    ).strip(),
-                ]
-                soup, url = None, None
+    # Each site is searched and parsed at most once per show; every field scraped
+    # from that site reuses the same page.
+    site_pages = {}
 
-                ordered_terms = []
-                for term in search_terms:
-                    if term not in ordered_terms:
-                        ordered_terms.append(term)
+    def find_soup(site):
+        if site in site_pages:
+            return site_pages[site]
+        page = (None, None)
+        for term in search_terms:
+            soup, url = get_soup_from_search(
+                term, s_name, s_year, site, lang, show_type, soup_cache
+            )
+            if soup:
+                page = (soup, url)
+                break
+        site_pages[site] = page
+        return page
+
+    def scrape(site, scraper):
+        soup, url = find_soup(site)
+        if not soup:
+            return None, url
+        return (
+            scraper(
+                soup=soup,
+                url=url,
+                sid=s_id,
+                show_name=s_name,
+                context=context,
+                artists_db=artists_db,
+            ),
+            url,
+        )
 
-                for term in ordered_terms:
-                    soup, url = get_soup_from_search(
-                        term, s_name, s_year, current_site, lang, show_type, soup_cache
-                    )
-                    if soup:
-                        break
+    # Primary sites are independent of each other, so search them concurrently.
+    # The field scrapers below then pick the pages up from site_pages.
+    primary_sites = list(dict.fromkeys(steps[0][0] for _, steps, _ in pending if steps))
+    if len(primary_sites) > 1:
+        list(_SHOW_FETCH_POOL.map(find_soup, primary_sites))
+    else:
+        for site in primary_sites:
+            find_soup(site)
+
+    # Scrapers only read the page they share and write their own keys, while
+    # the image and cast ones mostly wait on downloads; so every field's first
+    # step runs at once. Fallbacks and the merge into obj stay sequential.
+    first_steps = [(field, steps[0]) for field, steps, _ in pending if steps]
+    first_results = {
+        field: _SHOW_FETCH_POOL.submit(scrape, site, scraper)
+        for field, (site, scraper, _) in first_steps
+    }
 
-                if soup:
-                    scrape_args = {
-                        "soup": soup,
-                        "url": url,
-                        "sid": s_id,
-                        "show_name": s_name,
-                        "context": context,
-                        "artists_db": artists_db,
-                    }
-                    data = SCRAPE_MAP[current_site][field](**scrape_args)
-
-                    if data:
-                        if field == "network":
-                            existing = normalize_list(obj.get("network"))
-                            new_data = normalize_list(data)
-                            merged = []
-                            seen = set()
-                            for n in existing + new_data:
-                                if n.lower() not in seen:
-                                    merged.append(n)
-                                    seen.add(n.lower())
-                            if merged != existing or (is_empty and merged):
-                                obj["network"] = merged
-                                spu[field] = (
-                                    f"{initial_site} (Fallback: {current_site})"
-                                    if current_site != initial_site
-                                    else current_site
-                                )
-                                context["source_links_temp"][field] = url
-                                fetched_successfully = True
-                                break
-                        else:
-                            obj[field] = data
-                            spu[field] = (
-                                f"{initial_site} (Fallback: {current_site})"
-                                if current_site != initial_site
-                                else current_site
-                            )
-                            context["source_links_temp"][field] = url
-
-                            if field == "showImage" and data:
-                                img_path = os.path.join(SHOW_IMAGES_DIR, str(data))
-                                if (
-                                    img_path
-                                    not in context["files_generated"]["show_images"]
-                                ):
-                                    context["files_generated"]["show_images"].append(
-                                        img_path
-                                    )
-                            fetched_successfully = True
-                            break
+    for field, steps, is_empty in pending:
+        fetched_successfully = False
 
-            if not fetched_successfully and is_empty:
-                spu[field] = None
+        for step_idx, (current_site, scraper, label) in enumerate(steps):
+            if step_idx == 0:
+                data, url = first_results[field].result()
+            else:
+                data, url = scrape(current_site, scraper)
+
+            if data:
+                if field == "network":
+                    existing = normalize_list(obj.get("network"))
+                    new_data = normalize_list(data)
+                    merged = []
+                    seen = set()
+                    for n in existing + new_data:
+                        if n.lower() not in seen:
+                            merged.append(n)
+                            seen.add(n.lower())
+                    if merged != existing or (is_empty and merged):
+                        obj["network"] = merged
+                        spu[field] = label
+                        context["source_links_temp"][field] = url
+                        fetched_successfully = True
+                        break
+                else:
+                    obj[field] = data
+                    spu[field] = label
+                    context["source_links_temp"][field] = url
+
+                    if field == "showImage" and data:
+                        img_path = os.path.join(SHOW_IMAGES_DIR, str(data))
+                        if img_path not in context["files_generated"]["show_images"]:
+                            context["files_generated"]["show_images"].append(img_path)
+                    fetched_successfully = True
+                    break
+
+        if not fetched_successfully and is_empty:
+            spu[field] = None
 
     return obj
 
 
-def process_deletions(xl, context):
+def index_series_by_id(series_data):
+    series_by_id = {}
+    for o in series_data:
+        sid = o.get("showID")
+        if sid:
+            try:
+                series_by_id[int(sid)] = o
+            except ValueError:
+                pass
+    return series_by_id
+
+
+# The index is keyed by int showID, so ordering it is a C-level sort of ints
+# with no key function; the dict keeps the file's order, which makes that a
+# single linear pass when seriesData.json is already sorted.
+def series_in_id_order(series_by_id):
+    return [series_by_id[k] for k in sorted(series_by_id)]
+
+
+# Deletes in place from the series_by_id/cast_data main already loaded and
+# returns whether anything was deleted; main writes both files at the end.
+def process_deletions(xl, series_by_id, cast_data, context):
     try:
         target = next(
             (s for s in xl.sheet_names if s.strip().lower() == "deleting records"), None
         )
         if not target:
-            return
-        df = pd.read_excel(xl, sheet_name=target)
+            return False
+        # Only the ID column is used.
+        df = xl.parse(sheet_name=target, usecols=[0])
     except Exception:
-        return
+        return False
     if df.empty:
-        return
-
-    series_data = load_json_file(SERIES_JSON_FILE)
-    cast_data = load_json_file(CAST_JSON_FILE)
-
-    series_by_id = {}
-    for o in series_data:
-        if o.get("showID"):
-            try:
-                series_by_id[int(o["showID"])] = o
-            except ValueError:
-                pass
+        return False
 
     to_delete = set(pd.to_numeric(df.iloc[:, 0], errors="coerce").dropna().astype(int))
+    if not any(sid in series_by_id for sid in to_delete):
+        return False
     deleted_count = 0
 
+    # List the backup folders once and index their files by showID instead
+    # of re-listing both folders for every deleted show.
+    backups_by_sid = {}
+    for d in [BACKUP_DIR, BACKUP_META_DIR]:
+        for f in os.listdir(d) if os.path.exists(d) else []:
+            if f.endswith((".json", ".json.gz")) and os.path.isfile(os.path.join(d, f)):
+                file_sid = f.split(".", 1)[0].rsplit("_", 1)[-1]
+                backups_by_sid.setdefault((d, file_sid), []).append(f)
+
     for sid in to_delete:
         sid_str = str(sid)
         if sid in series_by_id:
@@ -1526,8 +2145,7 @@ def process_deletions(xl, context):
             if cast_obj:
                 archive_bundle["castData"] = cast_obj
 
-            path = os.path.join(DELETED_DATA_DIR, f"DELETED_{ts}_{sid}.json")
-            os.makedirs(DELETED_DATA_DIR, exist_ok=True)
+            path = os.path.join(DELETED_DATA_DIR, f"DELETED_{ts}_{sid}.json.gz")
             save_json_file(path, archive_bundle)
             context["files_generated"]["deleted_data"].append(path)
             context["report_data"].setdefault("Deleting Records", {}).setdefault(
@@ -1541,58 +2159,36 @@ def process_deletions(xl, context):
                 src = os.path.join(SHOW_IMAGES_DIR, img_name)
                 if os.path.exists(src):
                     dest = os.path.join(DELETE_IMAGES_DIR, f"DELETED_{ts}_{sid}.jpg")
-                    os.makedirs(DELETE_IMAGES_DIR, exist_ok=True)
                     shutil.move(src, dest)
                     context["files_generated"]["deleted_images"].append(dest)
 
             for d in [BACKUP_DIR, BACKUP_META_DIR]:
-                for f in os.listdir(d) if os.path.exists(d) else []:
+                for f in backups_by_sid.get((d, sid_str), []):
                     src_path = os.path.join(d, f)
-                    if f.endswith(f"_{sid}.json") and os.path.isfile(src_path):
-                        archive_dir = os.path.join(
-                            (
-                                ARCHIVED_BACKUPS_DIR
-                                if d == BACKUP_DIR
-                                else ARCHIVED_META_DIR
-                            ),
-                            sid_str,
+                    archive_dir = os.path.join(
+                        (
+                            ARCHIVED_BACKUPS_DIR
+                            if d == BACKUP_DIR
+                            else ARCHIVED_META_DIR
+                        ),
+                        sid_str,
+                    )
+                    os.makedirs(archive_dir, exist_ok=True)
+                    dest_path = os.path.join(archive_dir, f)
+                    shutil.move(src_path, dest_path)
+                    context["files_generated"][
+                        (
+                            "archived_backups"
+                            if d == BACKUP_DIR
+                            else "archived_meta_backups"
                         )
-                        os.makedirs(archive_dir, exist_ok=True)
-                        dest_path = os.path.join(archive_dir, f)
-                        shutil.move(src_path, dest_path)
-                        context["files_generated"][
-                            (
-                                "archived_backups"
-                                if d == BACKUP_DIR
-                                else "archived_meta_backups"
-                            )
-                        ].append(dest_path)
+                    ].append(dest_path)
             deleted_count += 1
 
-    if deleted_count > 0:
-        save_json_file(
-            SERIES_JSON_FILE,
-            sorted(
-                list(series_by_id.values()), key=lambda x: int(x.get("showID") or 0)
-            ),
-        )
-        save_json_file(CAST_JSON_FILE, cast_data)
+    return deleted_count > 0
 
 
 def apply_manual_updates(xl, by_id, context):
-    try:
-        target = next(
-            (s for s in xl.sheet_names if s.strip().lower() == "manual updates"), None
-        )
-        if not target:
-            return {}
-        df = pd.read_excel(xl, sheet_name=target, keep_default_na=False).replace(
-            {float("nan"): None, pd.NA: None}
-        )
-        df.columns = [c.strip().lower() for c in df.columns]
-    except Exception:
-        return {}
-
     MAP = {
         "image": "showImage",
         "other names": "otherNames",
@@ -1604,25 +2200,46 @@ def apply_manual_updates(xl, by_id, context):
         "tags": "tags",
     }
 
+    try:
+        target = next(
+            (s for s in xl.sheet_names if s.strip().lower() == "manual updates"), None
+        )
+        if not target:
+            return {}
+        # Only the ID and the mapped columns are ever read, so the reader
+        # skips converting any notes or helper columns on the sheet.
+        wanted = {"no", *MAP}
+        df = xl.parse(
+            sheet_name=target,
+            keep_default_na=False,
+            usecols=lambda c: str(c).strip().lower() in wanted,
+        ).replace({float("nan"): None, pd.NA: None})
+        df.columns = [c.strip().lower() for c in df.columns]
+    except Exception:
+        return {}
+
     report = {}
-    for _, row in df.iterrows():
-        sid = pd.to_numeric(row.get("no"), errors="coerce")
-        if pd.isna(sid) or int(sid) not in by_id:
+    if "no" not in df.columns:
+        return report
+
+    # Coerce the ID column once and read the update columns as plain lists
+    # instead of building a Series per row with iterrows().
+    sids = pd.to_numeric(df["no"], errors="coerce")
+    valid = sids.notna()
+    update_cols = [(col, key) for col, key in MAP.items() if col in df.columns]
+    columns = [df.loc[valid, col].tolist() for col, _ in update_cols]
+
+    for sid, *values in zip(sids[valid].astype(int).tolist(), *columns):
+        if sid not in by_id:
             continue
-        sid = int(sid)
-        obj, old, changed = by_id[sid], copy.deepcopy(by_id[sid]), {}
+        obj, changed = by_id[sid], {}
 
-        for col, key in MAP.items():
-            if (
-                col in row
-                and str(row[col]).strip()
-                and str(row[col]).strip().lower() != "nan"
-            ):
-                val = row[col]
+        for (col, key), val in zip(update_cols, values):
+            if str(val).strip() and str(val).strip().lower() != "nan":
                 image_downloaded = False
 
                 if key == "showImage":
-                    image_path = os.path.join(SHOW_IMAGES_DIR, f"{sid}.jpg")
+                    image_path = SHOW_IMAGE_PATH.format(sid)
                     if download_and_save_image(val, image_path):
                         val = os.path.basename(image_path)
                         context["files_generated"]["show_images"].append(image_path)
@@ -1630,7 +2247,7 @@ def apply_manual_updates(xl, by_id, context):
                     else:
                         continue
 
-                elif key in ["otherNames", "airedOn", "director", "tags"]:
+                elif key in {"otherNames", "airedOn", "director", "tags"}:
                     val = normalize_list(val)
 
                 else:
@@ -1650,10 +2267,13 @@ def apply_manual_updates(xl, by_id, context):
 
         if changed:
             obj["updatedDetails"] = (
-                f"{', '.join([human_readable_field(f) for f in changed])} Updated Manually"
+                f"{', '.join([FIELD_NAME_MAP.get(f, f) for f in changed])} Updated Manually"
             )
-            obj["updatedOn"] = now_ist().strftime("%d %B %Y")
-            report.setdefault("updated", []).append({"old": old, "new": obj})
+            obj["updatedOn"] = context["today_str"]
+            report.setdefault("updated", []).append(report_entry(obj))
+            # Only the overwritten values are kept; the diff backup never looks
+            # at the rest of the old record.
+            old = {k: v["old"] for k, v in changed.items()}
             create_diff_backup(old, obj, context, explicit_changes=changed)
             save_metadata_backup(obj, context)
 
@@ -1668,7 +2288,7 @@ def excel_to_objects(xl, sheet):
         )
         if not target:
             return [], []
-        df = pd.read_excel(xl, sheet_name=target, keep_default_na=False)
+        df = xl.parse(sheet_name=target, keep_default_na=False)
         df.columns = [c.strip().lower() for c in df.columns]
     except Exception:
         return [], []
@@ -1701,51 +2321,61 @@ def excel_to_objects(xl, sheet):
         "before feb 7 2023": 300,
         "mini drama": 400,
     }.get(sheet.lower(), 0)
-    processed = []
-    for index, row in df.iterrows():
-        obj, row_num = index + 2, index + 2
-        obj = {}
-        for col in df.columns[:again_idx]:
-            key, val = MAP.get(col, col.strip()), row[col]
-            if key in ("showID", "releasedYear", "totalEpisodes", "ratings"):
-                num_val = pd.to_numeric(val, errors="coerce")
-                if pd.isna(num_val):
-                    if val and str(val).strip():
-                        warnings.append(
-                            f"- Row {row_num}: Invalid value '{val}' in '{col}'. Using 0."
+    sheet_lower = sheet.lower()
+    show_type = (
+        "Movie"
+        if "movie" in sheet_lower
+        else "Mini Drama" if "mini" in sheet_lower else "Drama"
+    )
+
+    # Convert whole columns at once; rows are only assembled at the end.
+    row_warnings = []
+    columns = {}
+    # Output keys are resolved once per column (headers were stripped and
+    # lowercased above), and columns are taken by position so a duplicated
+    # header cannot turn a column lookup into a sub-frame.
+    for pos, col in enumerate(df.columns[:again_idx]):
+        key, values = MAP.get(col, col), df.iloc[:, pos]
+        if key in ("showID", "releasedYear", "totalEpisodes", "ratings"):
+            nums = pd.to_numeric(values, errors="coerce")
+            for index, val in values[nums.isna()].items():
+                if val and str(val).strip():
+                    row_warnings.append(
+                        (
+                            index,
+                            f"- Row {index + 2}: Invalid value '{val}' in '{col}'. Using 0.",
                         )
-                    obj[key] = 0
-                else:
-                    obj[key] = int(num_val)
-            else:
-                obj[key] = (
-                    ddmmyyyy(val)
-                    if key in ("watchStartedOn", "watchEndedOn")
-                    else (
-                        normalize_list(val)
-                        if key in ("genres", "network")
-                        else str(val).strip() if val else None
                     )
-                )
+            columns[key] = nums.fillna(0).astype(int).tolist()
+        elif key in ("watchStartedOn", "watchEndedOn"):
+            columns[key] = ddmmyyyy_column(values)
+        elif key in ("genres", "network"):
+            columns[key] = [normalize_list(v) for v in values]
+        else:
+            columns[key] = [str(v).strip() if v else None for v in values.tolist()]
+    warnings.extend(msg for _, msg in sorted(row_warnings, key=itemgetter(0)))
 
+    again_columns = [
+        ddmmyyyy_column(df.iloc[:, i]) for i in range(again_idx, len(df.columns))
+    ]
+    again_rows = zip(*again_columns) if again_columns else [()] * len(df)
+
+    keys = list(columns)
+    processed = []
+    for values, again in zip(zip(*columns.values()), again_rows):
+        obj = dict(zip(keys, values))
         if obj.get("showID", 0) != 0:
             obj["showID"] += base_id
         if not obj.get("showID") or not obj.get("showName"):
             continue
-        obj["againWatchedDates"] = [ddmmyyyy(d) for d in row[again_idx:] if ddmmyyyy(d)]
-
-        sheet_lower = sheet.lower()
-        obj["showType"] = (
-            "Movie"
-            if "movie" in sheet_lower
-            else "Mini Drama" if "mini" in sheet_lower else "Drama"
-        )
+        obj["againWatchedDates"] = [d for d in again if d]
+        obj["showType"] = show_type
         # --- FIXED: Automatic Country Mapping ---
         lang = obj.get("nativeLanguage", "").strip().lower()
         obj["nativeLanguage"] = lang.capitalize()
         if not obj.get("country") or pd.isna(obj.get("country")):
             obj["country"] = LANG_TO_COUNTRY_MAP.get(lang)
-            
+
         processed.append(obj)
     return processed, warnings
 
@@ -1772,7 +2402,7 @@ def save_metadata_backup(obj, context):
     data = {
         "scriptVersion": SCRIPT_VERSION,
         "runID": context["run_id"],
-        "timestamp": now_ist().strftime("%d %B %Y %I:%M %p (IST)"),
+        "timestamp": context["run_time_str"],
         "showID": obj["showID"],
         "showName": obj["showName"],
     }
@@ -1785,23 +2415,39 @@ def save_metadata_backup(obj, context):
         return
 
     path = os.path.join(
-        BACKUP_META_DIR, f"META_{context['file_ts']}_{obj['showID']}.json"
+        BACKUP_META_DIR, f"META_{context['file_ts']}_{obj['showID']}.json.gz"
     )
-    os.makedirs(BACKUP_META_DIR, exist_ok=True)
-    save_json_file(path, data)
+    # Written in one pass by flush_backups() once the rows are done.
+    context["pending_backups"].append((path, data))
     context["files_generated"]["meta_backups"].append(path)
 
 
+def flush_backups(context):
+    # Each backup is its own small .json.gz; gzip and the file writes release
+    # the GIL, so a few threads write the queue faster than one at a time.
+    # A show backed up twice in a run keeps its last backup, as when the
+    # writes were sequential, and no two threads share a temp file.
+    pending = context["pending_backups"]
+    latest = dict(pending)
+    if latest:
+        with ThreadPoolExecutor(
+            max_workers=min(BACKUP_WRITE_WORKERS, len(latest))
+        ) as pool:
+            list(pool.map(save_json_file, latest.keys(), latest.values()))
+    pending.clear()
+
+
 def create_diff_backup(old, new, context, explicit_changes=None):
     if explicit_changes is not None:
         changed_fields = explicit_changes
     else:
         changed_fields = {}
         for key, new_val in new.items():
-            if key not in LOCKED_FIELDS_AFTER_CREATION and normalize_list(
-                old.get(key)
-            ) != normalize_list(new_val):
-                changed_fields[key] = {"old": old.get(key), "new": new_val}
+            if key in LOCKED_FIELDS_AFTER_CREATION:
+                continue
+            old_val = old.get(key)
+            if values_differ(old_val, new_val):
+                changed_fields[key] = {"old": old_val, "new": new_val}
 
     if not changed_fields:
         return
@@ -1809,7 +2455,7 @@ def create_diff_backup(old, new, context, explicit_changes=None):
     data = {
         "scriptVersion": SCRIPT_VERSION,
         "runID": context["run_id"],
-        "timestamp": now_ist().strftime("%d %B %Y %I:%M %p (IST)"),
+        "timestamp": context["run_time_str"],
         "backupType": "partial_diff",
         "showID": new["showID"],
         "showName": new["showName"],
@@ -1818,14 +2464,64 @@ def create_diff_backup(old, new, context, explicit_changes=None):
         "changedFields": changed_fields,
     }
     path = os.path.join(BACKUP_DIR, f"BACKUP_{context['file_ts']}_{new['showID']}.json")
-    os.makedirs(BACKUP_DIR, exist_ok=True)
-    save_json_file(path, data)
+    context["pending_backups"].append((path, data))
     context["files_generated"]["backups"].append(path)
 
 
 # ---------------------------- write_report ----------------------------
 def write_report(context, current_run_seconds, run_start_time, report_file_path):
     is_paused = context.get("paused")
+    # Shared by the console and master reports and the email subject, so all
+    # three carry the same end time.
+    end_time = now_ist()
+    end_time_ist = end_time.strftime("%d %B %Y - %I:%M:%S %p")
+    run_start_ist = run_start_time.strftime("%d %B %Y - %I:%M:%S %p")
+    is_manual = os.environ.get("GITHUB_EVENT_NAME") == "workflow_dispatch"
+    trigger_type = "Manual" if is_manual else "Automatic"
+    current_gh_run = os.environ.get("GITHUB_RUN_NUMBER", "Local")
+    ordered_sheets = [
+        s.strip()
+        for s in os.environ.get("SHEETS", "Feb 7 2023 Onwards").split(";")
+        if s.strip()
+    ]
+
+    # Database totals are the same in both report texts, so they are gathered
+    # once. main passes the sizes it already holds in memory; a file it did not
+    # report is decoded from disk.
+    object_counts = context.get("object_counts", {})
+    inventory = []
+    for file in [
+        SERIES_JSON_FILE,
+        ARTISTS_JSON_FILE,
+        CAST_JSON_FILE,
+        ARTIST_LOOKUP_FILE,
+    ]:
+        count = object_counts.get(file)
+        if count is None:
+            try:
+                with open(file, "rb") as f:
+                    count = len(decode_json(f.read()))
+            except Exception:
+                count = 0
+        inventory.append(f"📦 Total Objects in {file}: {count}")
+
+    try:
+        show_img_count = len(
+            [f for f in os.listdir(SHOW_IMAGES_DIR) if f.lower().endswith(".jpg")]
+        )
+        inventory.append(f"🖼️ Total images in {SHOW_IMAGES_DIR}: {show_img_count}")
+    except Exception:
+        inventory.append(f"🖼️ Total images in {SHOW_IMAGES_DIR}: 0")
+
+    try:
+        artist_img_count = len(
+            [f for f in os.listdir(ARTIST_IMAGES_DIR) if f.lower().endswith(".jpg")]
+        )
+        inventory.append(
+            f"🧑‍🎨 Total images in {ARTIST_IMAGES_DIR}: {artist_img_count}"
+        )
+    except Exception:
+        inventory.append(f"🧑‍🎨 Total images in {ARTIST_IMAGES_DIR}: 0")
 
     def build_report_text(rep_data, files_data, is_cumulative):
         if is_cumulative:
@@ -1841,7 +2537,7 @@ def write_report(context, current_run_seconds, run_start_time, report_file_path)
             total_seconds = int(current_run_seconds)
             run_label = "⏱️ Run Time      : "
             batch_label = f"🔄 Current Batch : {context.get('batch_run_count', 1)}"
-            start_time_str = run_start_time.strftime("%d %B %Y - %I:%M:%S %p")
+            start_time_str = run_start_ist
             if is_paused:
                 status_msg = "✅ Partial Batch completed successfully"
                 batch_msg = "⏳ Batch Processing in Progress..."
@@ -1860,11 +2556,6 @@ def write_report(context, current_run_seconds, run_start_time, report_file_path)
         else:
             runtime_str = f"{seconds} Second{'s' if seconds != 1 else ''}"
 
-        is_manual = os.environ.get("GITHUB_EVENT_NAME") == "workflow_dispatch"
-        trigger_type = "Manual" if is_manual else "Automatic"
-        end_time_ist = now_ist().strftime("%d %B %Y - %I:%M:%S %p")
-
-        current_gh_run = os.environ.get("GITHUB_RUN_NUMBER", "Local")
         if is_cumulative:
             first_run = context.get("first_run_id", current_gh_run)
             run_display = (
@@ -1875,11 +2566,6 @@ def write_report(context, current_run_seconds, run_start_time, report_file_path)
         else:
             run_display = f"{current_gh_run}"
 
-        ordered_sheets = [
-            s.strip()
-            for s in os.environ.get("SHEETS", "Feb 7 2023 Onwards").split(";")
-            if s.strip()
-        ]
         all_rep_keys = list(rep_data.keys())
         sorted_rep_keys = [s for s in ordered_sheets if s in all_rep_keys] + [
             k for k in all_rep_keys if k not in ordered_sheets
@@ -1917,6 +2603,9 @@ def write_report(context, current_run_seconds, run_start_time, report_file_path)
             "archived": 0,
         }
 
+        def get_unique(lst):
+            return list(dict.fromkeys(lst))
+
         for sheet in sorted_rep_keys:
             changes = rep_data[sheet]
             if not any(v for k, v in changes.items()):
@@ -1924,86 +2613,85 @@ def write_report(context, current_run_seconds, run_start_time, report_file_path)
             display_sheet = sheet.replace("sheet", "Sheet ").title()
             lines.extend([sep, f"🗂️ === {display_sheet} ===", sep])
 
-            def get_unique(lst):
-                return list(dict.fromkeys(lst))
-
-            if changes.get("created"):
+            created = changes.get("created") or []
+            # Batch states saved before updates were stored flat wrap each
+            # entry as {"old": ..., "new": ...}.
+            updated = [p.get("new", p) for p in changes.get("updated") or []]
+            refetched = changes.get("refetched") or []
+            skipped = changes.get("skipped") or []
+            ignored = changes.get("ignored_non_asian") or []
+            data_warnings = get_unique(changes.get("data_warnings") or [])
+            # These sections are printed sorted, so a set de-duplicates them
+            # without keeping first-seen order.
+            fetched_data = sorted(set(changes.get("fetched_data") or []))
+            missing_asian = sorted(set(changes.get("missing_warnings_asian") or []))
+            artist_warnings = sorted(set(changes.get("artist_image_warnings") or []))
+            data_deleted = changes.get("data_deleted")
+
+            if created:
                 lines.append("\n🆕 Data Created:")
                 seen_c = set()
-                for o in changes["created"]:
+                for o in created:
                     if o["showID"] not in seen_c:
                         lines.append(
                             f"- {o['showID']} - {o['showName']} ({o.get('releasedYear')}) -> {o.get('updatedDetails', '')}"
                         )
                         seen_c.add(o["showID"])
 
-            if changes.get("updated"):
+            if updated:
                 lines.append("\n🔁 Data Updated:")
                 seen_u = set()
-                for p in changes["updated"]:
-                    if p["new"]["showID"] not in seen_u:
+                for o in updated:
+                    if o["showID"] not in seen_u:
                         lines.append(
-                            f"✍️ {p['new']['showID']} - {p['new']['showName']} ({p['new'].get('releasedYear')}) -> {p['new']['updatedDetails']}"
+                            f"✍️ {o['showID']} - {o['showName']} ({o.get('releasedYear')}) -> {o['updatedDetails']}"
                         )
-                        seen_u.add(p["new"]["showID"])
+                        seen_u.add(o["showID"])
 
-            if changes.get("refetched"):
+            if refetched:
                 lines.append("\n🔍 Refetched Data:")
                 seen_r = set()
-                for o in changes["refetched"]:
+                for o in refetched:
                     if o["id"] not in seen_r:
                         lines.append(
                             f"✨ {o['id']} - {o['name']} ({o.get('year')}) -> Fetched: {', '.join(o['fields'])}"
                         )
                         seen_r.add(o["id"])
 
-            if changes.get("data_warnings"):
+            if data_warnings:
                 lines.append("\n⚠️ Data Validation Warnings:")
-                for i in get_unique(changes["data_warnings"]):
-                    lines.append(i)
+                lines.extend(data_warnings)
 
-            if changes.get("fetched_data"):
+            if fetched_data:
                 lines.append("\n🖼️ Fetched Data Details:")
-                for i in sorted(get_unique(changes["fetched_data"])):
-                    lines.append(i)
+                lines.extend(fetched_data)
 
-            if changes.get("missing_warnings_asian"):
+            if missing_asian:
                 lines.append("\n⚠️ Missing Values (Asian Dramas):")
-                for i in sorted(get_unique(changes["missing_warnings_asian"])):
-                    lines.append(i)
+                lines.extend(missing_asian)
 
-            if changes.get("artist_image_warnings"):
+            if artist_warnings:
                 lines.append("\n🧑‍🎨 Artist Image Warnings:")
-                for i in sorted(get_unique(changes["artist_image_warnings"])):
-                    lines.append(i)
+                lines.extend(artist_warnings)
 
-            if changes.get("skipped"):
+            if skipped:
                 lines.append("\n🚫 Skipped (Unchanged):")
-                for i in sorted(get_unique(changes["skipped"])):
-                    lines.append(f"- {i}")
+                lines.extend(f"- {i}" for i in sorted(set(skipped)))
 
-            if changes.get("ignored_non_asian"):
+            if ignored:
                 lines.append("\n🙈 Ignored (Non-Asian / Western Shows):")
-                for i in sorted(get_unique(changes["ignored_non_asian"])):
-                    lines.append(f"- {i}")
+                lines.extend(f"- {i}" for i in sorted(set(ignored)))
 
-            if changes.get("data_deleted"):
+            if data_deleted:
                 lines.append("\n❌ Data Deleted:")
-                for i in get_unique(changes["data_deleted"]):
-                    lines.append(i)
-
-            if sheet not in ["Deleting Records", "Manual Updates"]:
-                s_created = len(set(o["showID"] for o in changes.get("created", [])))
-                s_updated = len(
-                    set(o["new"]["showID"] for o in changes.get("updated", []))
-                )
-                s_refetched = len(set(o["id"] for o in changes.get("refetched", [])))
-                s_skipped = len(
-                    set(i.split(" - ")[0] for i in changes.get("skipped", []))
-                )
-                s_ignored = len(
-                    set(i.split(" - ")[0] for i in changes.get("ignored_non_asian", []))
-                )
+                lines.extend(get_unique(data_deleted))
+
+            if sheet not in SKIP_STAT_SHEETS:
+                s_created = len(set(o["showID"] for o in created))
+                s_updated = len(set(o["showID"] for o in updated))
+                s_refetched = len(set(o["id"] for o in refetched))
+                s_skipped = len(set(i.split(" - ")[0] for i in skipped))
+                s_ignored = len(set(i.split(" - ")[0] for i in ignored))
                 total_sheet = (
                     s_created + s_updated + s_refetched + s_skipped + s_ignored
                 )
@@ -2015,16 +2703,12 @@ def write_report(context, current_run_seconds, run_start_time, report_file_path)
                 stats["refetched"] += s_refetched
 
                 stats["show_images"] += sum(
-                    1
-                    for i in get_unique(changes.get("fetched_data", []))
-                    if "Show Image" in i
+                    1 for i in fetched_data if "Show Image" in i
                 )
                 stats["rows"] += total_sheet
 
                 warn_count = (
-                    len(get_unique(changes.get("data_warnings", [])))
-                    + len(get_unique(changes.get("missing_warnings_asian", [])))
-                    + len(get_unique(changes.get("artist_image_warnings", [])))
+                    len(data_warnings) + len(missing_asian) + len(artist_warnings)
                 )
                 stats["warnings"] += warn_count
 
@@ -2076,35 +2760,7 @@ def write_report(context, current_run_seconds, run_start_time, report_file_path)
             ]
         )
 
-        for file in [
-            SERIES_JSON_FILE,
-            ARTISTS_JSON_FILE,
-            CAST_JSON_FILE,
-            ARTIST_LOOKUP_FILE,
-        ]:
-            try:
-                with open(file, "r", encoding="utf-8") as f:
-                    lines.append(f"📦 Total Objects in {file}: {len(json.load(f))}")
-            except Exception:
-                lines.append(f"📦 Total Objects in {file}: 0")
-
-        try:
-            show_img_count = len(
-                [f for f in os.listdir(SHOW_IMAGES_DIR) if f.lower().endswith(".jpg")]
-            )
-            lines.append(f"🖼️ Total images in {SHOW_IMAGES_DIR}: {show_img_count}")
-        except Exception:
-            lines.append(f"🖼️ Total images in {SHOW_IMAGES_DIR}: 0")
-
-        try:
-            artist_img_count = len(
-                [f for f in os.listdir(ARTIST_IMAGES_DIR) if f.lower().endswith(".jpg")]
-            )
-            lines.append(
-                f"🧑‍🎨 Total images in {ARTIST_IMAGES_DIR}: {artist_img_count}"
-            )
-        except Exception:
-            lines.append(f"🧑‍🎨 Total images in {ARTIST_IMAGES_DIR}: 0")
+        lines.extend(inventory)
 
         lines.extend([sep, "🗂️ Folders Generated:", sep])
         for folder, files in files_data.items():
@@ -2113,11 +2769,11 @@ def write_report(context, current_run_seconds, run_start_time, report_file_path)
                 total_files = len(unique_files)
                 lines.append(f"📁 {folder}/ (Total: {total_files} files)")
                 if total_files <= 8:
-                    for p in unique_files:
-                        lines.append(f"    📄 {os.path.basename(p)}")
+                    lines.extend(f"    📄 {os.path.basename(p)}" for p in unique_files)
                 else:
-                    for p in unique_files[:5]:
-                        lines.append(f"    📄 {os.path.basename(p)}")
+                    lines.extend(
+                        f"    📄 {os.path.basename(p)}" for p in unique_files[:5]
+                    )
                     lines.append(f"    ... and {total_files - 5} more files.")
                 lines.append("")
 
@@ -2146,9 +2802,10 @@ def write_report(context, current_run_seconds, run_start_time, report_file_path)
     step_summary_file = os.environ.get("GITHUB_STEP_SUMMARY")
     if step_summary_file:
         with open(step_summary_file, "a", encoding="utf-8") as f:
-            f.write("### 📊 Workflow Execution Report (Current Batch)\n```text\n")
-            f.write(console_output)
-            f.write("\n```\n")
+            f.write(
+                "### 📊 Workflow Execution Report (Current Batch)\n```text\n"
+                f"{console_output}\n```\n"
+            )
 
     if is_paused:
         with open(report_file_path, "w", encoding="utf-8") as f:
@@ -2168,10 +2825,8 @@ def write_report(context, current_run_seconds, run_start_time, report_file_path)
             f.write(file_output)
         print(f"\n✅ Final Master Report written -> {report_file_path} (Saved to Repo)")
 
-    is_manual = os.environ.get("GITHUB_EVENT_NAME") == "workflow_dispatch"
-    trigger_type = "Manual" if is_manual else "Automatic"
     mail_trigger = f"[{trigger_type}]"
-    mail_date = now_ist().strftime("%d %B %Y %I:%M %p IST")
+    mail_date = end_time.strftime("%d %B %Y %I:%M %p IST")
     email_subject = f"{mail_trigger} Workflow {mail_date} Report"
     with open("EMAIL_SUBJECT.txt", "w", encoding="utf-8") as ef:
         ef.write(email_subject)
@@ -2185,27 +2840,32 @@ def process_and_distribute_cast(full_cast, artists_db, context):
     if not full_cast:
         return {}, {}
 
-    known_crew_roles = [
-        "director",
-        "writer",
-        "screenwriter",
-        "composer",
-        "producer",
-        "creator",
-        "executive",
-        "editor",
-        "cinematographer",
-        "music",
-        "art",
-    ]
+    # Download every new artist's headshot concurrently up front; the loop
+    # below then registers the artists in cast order as before.
+    new_artists = {}
+    for artist in full_cast:
+        if artist["artistID"] not in artists_db:
+            new_artists.setdefault(artist["artistID"], artist)
+
+    def fetch_artist_image(artist):
+        image_path = ARTIST_IMAGE_PATH.format(artist["artistID"])
+        return image_path, artist["artistImageURL"] and download_and_save_image(
+            artist["artistImageURL"], image_path, is_artist=True
+        )
+
+    artist_images = {}
+    if new_artists:
+        with ThreadPoolExecutor(
+            max_workers=min(ARTIST_IMAGE_WORKERS, len(new_artists))
+        ) as pool:
+            artist_images = dict(
+                zip(new_artists, pool.map(fetch_artist_image, new_artists.values()))
+            )
 
     for artist in full_cast:
         artist_id = artist["artistID"]
         if artist_id not in artists_db:
-            image_path = os.path.join(ARTIST_IMAGES_DIR, f"{artist_id}.jpg")
-            image_downloaded = artist["artistImageURL"] and download_and_save_image(
-                artist["artistImageURL"], image_path, is_artist=True
-            )
+            image_path, image_downloaded = artist_images[artist_id]
 
             if image_downloaded:
                 artists_db[artist_id] = {
@@ -2264,7 +2924,7 @@ def process_and_distribute_cast(full_cast, artists_db, context):
         elif role == "Guest Role":
             guest_cast.append(cast_member)
         else:
-            if any(re.search(rf"\b{kcr}\b", role.lower()) for kcr in known_crew_roles):
+            if KNOWN_CREW_ROLE_RE.search(role.lower()):
                 crew_cast.append(cast_member)
             else:
                 other_crew_cast.append(cast_member)
@@ -2304,29 +2964,41 @@ def fetch_excel_from_gdrive_bytes(file_id, creds_path):
         creds = service_account.Credentials.from_service_account_file(
             creds_path, scopes=["https://www.googleapis.com/auth/drive.readonly"]
         )
-        service = build("drive", "v3", credentials=creds)
+        files = build("drive", "v3", credentials=creds).files()
+
+        def download(request):
+            fh = tempfile.SpooledTemporaryFile(max_size=EXCEL_SPOOL_BYTES)
+            downloader = MediaIoBaseDownload(fh, request, chunksize=EXCEL_SPOOL_BYTES)
+            done = False
+            while not done:
+                _, done = downloader.next_chunk()
+            fh.seek(0)
+            return fh
+
+        # get_media() only builds the request; a native Google Sheet fails on
+        # the first next_chunk() with 403 and has to be exported as .xlsx.
         try:
-            request = service.files().get_media(fileId=file_id)
-        except Exception:
-            request = service.files().export_media(
-                fileId=file_id,
-                mimeType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            return download(files.get_media(fileId=file_id))
+        except HttpError as e:
+            if e.resp.status != 403:
+                raise
+            return download(
+                files.export_media(
+                    fileId=file_id,
+                    mimeType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                )
             )
-        fh = io.BytesIO()
-        downloader = MediaIoBaseDownload(fh, request)
-        done = False
-        while not done:
-            _, done = downloader.next_chunk()
-        fh.seek(0)
-        return fh
     except Exception as e:
         return None
 
 
 def load_json_file(file_path):
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(file_path, "rb", buffering=JSON_IO_BUFFER) as f:
+            raw = f.read()
+        if file_path.endswith(".gz"):
+            raw = gzip.decompress(raw)
+        return decode_json(raw)
     except FileNotFoundError:
         return {} if file_path in [ARTISTS_JSON_FILE, CAST_JSON_FILE] else []
     except json.JSONDecodeError as e:
@@ -2336,14 +3008,29 @@ def load_json_file(file_path):
 
 def save_json_file(file_path, data):
     temp_path = file_path + ".tmp"
-    with open(temp_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
+    payload = encode_json(data)
+    if file_path.endswith(".gz"):
+        # Level 3 gets most of gzip's ratio on JSON at a fraction of the CPU.
+        payload = gzip.compress(payload, compresslevel=3)
+    with open(temp_path, "wb", buffering=JSON_IO_BUFFER) as f:
+        f.write(payload)
     os.replace(temp_path, file_path)
 
 
 # ---------------------------- MAIN ENGINE ----------------------------
 def main():
     setup_gitignore_for_partials()
+    # Output folders are created once up front instead of on every write.
+    for d in [
+        SHOW_IMAGES_DIR,
+        ARTIST_IMAGES_DIR,
+        BACKUP_DIR,
+        BACKUP_META_DIR,
+        DELETED_DATA_DIR,
+        DELETE_IMAGES_DIR,
+        REPORTS_DIR,
+    ]:
+        os.makedirs(d, exist_ok=True)
     MAX_FETCHES = int(os.environ.get("MAX_FETCHES", "50"))
     force_refetch_str = os.environ.get("FORCE_REFETCH", "")
     force_ids, force_all = parse_force_refetch(force_refetch_str)
@@ -2371,10 +3058,15 @@ def main():
         "previous_files_generated": {},
         "cumulative_time_seconds": 0,
         "global_start_time": run_start_time.strftime("%d %B %Y - %I:%M:%S %p"),
+        # Formatted once per run instead of for every created/updated row.
+        "today_str": run_start_time.strftime("%d %B %Y"),
+        "run_time_str": run_start_time.strftime("%d %B %Y %I:%M %p (IST)"),
         "batch_run_count": 1,
         "paused": False,
         "first_run_id": current_gh_run,
         "processed_ids_all_runs": set(),
+        "prefetched": {},
+        "pending_backups": [],
     }
 
     merge_batch_state(context)
@@ -2384,42 +3076,53 @@ def main():
     with open(EXCEL_FILE_ID_TXT, "r") as f:
         excel_id = f.read().strip()
 
-    excel_bytes = fetch_excel_from_gdrive_bytes(excel_id, SERVICE_ACCOUNT_FILE)
-    if not excel_bytes:
+    excel_file = fetch_excel_from_gdrive_bytes(excel_id, SERVICE_ACCOUNT_FILE)
+    if not excel_file:
         sys.exit(1)
-    xl = pd.ExcelFile(io.BytesIO(excel_bytes.getvalue()))
-    process_deletions(xl, context)
-
-    series_data = load_json_file(SERIES_JSON_FILE)
-    artists_data = load_json_file(ARTISTS_JSON_FILE)
+    xl = pd.ExcelFile(excel_file, engine=EXCEL_ENGINE)
+    merged_by_id = index_series_by_id(load_json_file(SERIES_JSON_FILE))
     cast_data = load_json_file(CAST_JSON_FILE)
-    merged_by_id = {int(o["showID"]): o for o in series_data if o.get("showID")}
+    deleted = process_deletions(xl, merged_by_id, cast_data, context)
+    artists_data = load_json_file(ARTISTS_JSON_FILE)
+    initial_artist_count = len(artists_data)
+    cast_updated = deleted
     manual_report = apply_manual_updates(xl, merged_by_id, context)
+    series_updated = deleted or bool(manual_report)
     if manual_report:
         context["report_data"]["Manual Updates"] = manual_report
     sheets_to_process = [
         s.strip() for s in os.environ.get("SHEETS", "Feb 7 2023 Onwards").split(";") if s.strip()
     ]
+    # Sheets share the fetch budget, caches and artist/cast data, so they are
+    # still processed one after another; only the parsing runs ahead, on a
+    # single thread so the workbook is never read from two threads at once.
+    sheet_pool = ThreadPoolExecutor(max_workers=1)
+    parsed_sheets = [
+        sheet_pool.submit(excel_to_objects, xl, s) for s in sheets_to_process
+    ]
 
-    for sheet in sheets_to_process:
+    for sheet, parsed in zip(sheets_to_process, parsed_sheets):
         if limit_reached:
             break
         context["current_sheet"] = sheet
         report = context["report_data"].setdefault(sheet, {})
-        excel_rows, warnings = excel_to_objects(xl, sheet)
+        excel_rows, warnings = parsed.result()
         if warnings:
             report.setdefault("data_warnings", []).extend(warnings)
 
-        for excel_obj in excel_rows:
+        # Most rows are unchanged and only go through the checks below, so
+        # their per-row lookups are bound to locals once per sheet.
+        processed_ids = context["processed_ids_all_runs"]
+        stored_show = merged_by_id.get
+        for row_idx, excel_obj in enumerate(excel_rows):
             sid = excel_obj["showID"]
-            if sid in context["processed_ids_all_runs"]:
+            if sid in processed_ids:
                 continue
 
-            old_obj_from_json = merged_by_id.get(sid)
+            old_obj_from_json = stored_show(sid)
             is_new = old_obj_from_json is None
-            excel_data_has_changed = not is_new and objects_differ(
-                old_obj_from_json, excel_obj
-            )
+            diff_keys = [] if is_new else objects_differ(old_obj_from_json, excel_obj)
+            excel_data_has_changed = bool(diff_keys)
             metadata_is_missing = not is_new and has_missing_metadata(old_obj_from_json)
             is_forced = force_all or (sid in force_ids)
 
@@ -2429,22 +3132,35 @@ def main():
                     context["paused"] = True
                     break
                 total_heavy_fetches += 1
-                base_template = copy.deepcopy(JSON_OBJECT_TEMPLATE)
-                old_data = copy.deepcopy(old_obj_from_json) if old_obj_from_json else {}
+
+                # Search the next few new shows' pages while this one is scraped,
+                # never more than the rows left in this run's fetch budget.
+                prefetched = context["prefetched"]
+                budget = (
+                    MAX_FETCHES - total_heavy_fetches - len(prefetched)
+                    if MAX_FETCHES > 0
+                    else PREFETCH_AHEAD
+                )
+                for next_obj in excel_rows[row_idx + 1 : row_idx + 1 + PREFETCH_AHEAD]:
+                    if budget <= 0:
+                        break
+                    next_sid = next_obj["showID"]
+                    if (
+                        next_sid not in merged_by_id
+                        and next_sid not in processed_ids
+                        and next_sid not in prefetched
+                    ):
+                        prefetched[next_sid] = _PREFETCH_POOL.submit(
+                            prefetch_show_pages, next_obj
+                        )
+                        budget -= 1
+                base_template = new_show_object()
+                # Shallow is enough: nested values are only ever replaced, never
+                # edited in place, and sitePriorityUsed is copied below.
+                old_data = dict(old_obj_from_json) if old_obj_from_json else {}
 
                 if is_forced and not is_new:
-                    for forced_field in [
-                        "synopsis",
-                        "showImage",
-                        "otherNames",
-                        "releaseDate",
-                        "Duration",
-                        "director",
-                        "tags",
-                        "cast",
-                        "network",
-                        "airedOn",
-                    ]:
+                    for forced_field in METADATA_FIELDS:
                         if (
                             old_data.get("sitePriorityUsed", {}).get(forced_field)
                             == "Manual"
@@ -2474,36 +3190,16 @@ def main():
                         else:
                             final_obj[k] = old_data[k]
 
-                final_obj["sitePriorityUsed"] = copy.deepcopy(
+                # Its values are plain strings or None, so a flat copy suffices.
+                final_obj["sitePriorityUsed"] = dict(
                     final_obj.get("sitePriorityUsed")
                     or JSON_OBJECT_TEMPLATE["sitePriorityUsed"]
                 )
-                initial_metadata_state = {
-                    k: final_obj.get(k)
-                    for k in [
-                        "synopsis",
-                        "showImage",
-                        "otherNames",
-                        "releaseDate",
-                        "Duration",
-                        "director",
-                        "tags",
-                        "cast",
-                        "network",
-                        "airedOn",
-                    ]
-                }
+                initial_metadata = {k: final_obj.get(k) for k in METADATA_FIELDS}
                 context["new_artists_added"] = []
 
                 lang = final_obj.get("nativeLanguage", "").lower()
-                is_asian = lang in [
-                    "korean",
-                    "chinese",
-                    "japanese",
-                    "thai",
-                    "taiwanese",
-                    "filipino",
-                ]
+                is_asian = lang in ASIAN_LANGUAGES
 
                 if is_asian:
                     final_obj = fetch_and_populate_metadata(
@@ -2516,6 +3212,7 @@ def main():
                     final_obj["cast"] = cast_summary
                     if full_cast_dict:
                         cast_data[str(sid)] = full_cast_dict
+                        cast_updated = True
 
                 final_obj.pop("extendedCastInfo", None)
                 final_obj["topRatings"] = (
@@ -2524,33 +3221,20 @@ def main():
                     * 100
                 )
                 metadata_was_fetched = any(
-                    final_obj.get(k) != v for k, v in initial_metadata_state.items()
+                    final_obj.get(k) != v for k, v in initial_metadata.items()
                 )
 
-                key_map = {
-                    "synopsis": "Synopsis",
-                    "showImage": "Show Image",
-                    "otherNames": "Other Names",
-                    "releaseDate": "Release Date",
-                    "Duration": "Duration",
-                    "director": "Director",
-                    "tags": "Tags",
-                    "cast": "Cast",
-                    "network": "Network",
-                    "airedOn": "Aired On",
-                }
-                newly_fetched_fields = sorted(
-                    [
-                        key_map[k]
-                        for k, v in initial_metadata_state.items()
-                        if is_empty_val(v) and not is_empty_val(final_obj.get(k))
-                    ]
-                )
+                newly_fetched_fields = [
+                    label
+                    for k, label in METADATA_LABELS
+                    if is_empty_val(initial_metadata[k])
+                    and not is_empty_val(final_obj.get(k))
+                ]
 
                 if is_new:
                     final_obj["updatedDetails"] = "First Time Uploaded"
-                    final_obj["updatedOn"] = now_ist().strftime("%d %B %Y")
-                    report.setdefault("created", []).append(final_obj)
+                    final_obj["updatedOn"] = context["today_str"]
+                    report.setdefault("created", []).append(report_entry(final_obj))
                     if newly_fetched_fields:
                         report.setdefault("fetched_data", []).append(
                             f"- {sid} - {final_obj['showName']} ({final_obj.get('releasedYear')}) -> Fetched: {', '.join(newly_fetched_fields)}"
@@ -2558,17 +3242,13 @@ def main():
                 else:
                     if excel_data_has_changed:
                         changes = [
-                            human_readable_field(k)
-                            for k, v in excel_obj.items()
-                            if normalize_list(old_obj_from_json.get(k))
-                            != normalize_list(v)
-                            and k not in LOCKED_FIELDS_AFTER_CREATION
+                            FIELD_NAME_MAP.get(k, k)
+                            for k in diff_keys
+                            if k in excel_obj
                         ]
                         final_obj["updatedDetails"] = f"{', '.join(changes)} Updated"
-                        final_obj["updatedOn"] = now_ist().strftime("%d %B %Y")
-                        report.setdefault("updated", []).append(
-                            {"old": old_obj_from_json, "new": final_obj}
-                        )
+                        final_obj["updatedOn"] = context["today_str"]
+                        report.setdefault("updated", []).append(report_entry(final_obj))
                         create_diff_backup(old_obj_from_json, final_obj, context)
 
                     if metadata_was_fetched and newly_fetched_fields:
@@ -2595,45 +3275,32 @@ def main():
                         )
 
                 merged_by_id[sid] = final_obj
+                series_updated = True
                 
                 # --- FIXED: Only save backup if something changed or was fetched ---
                 if is_new or excel_data_has_changed or metadata_was_fetched:
                     save_metadata_backup(final_obj, context)
 
                 if is_asian:
-                    missing_fields = {
-                        "synopsis",
-                        "showImage",
-                        "otherNames",
-                        "releaseDate",
-                        "Duration",
-                        "director",
-                        "tags",
-                        "cast",
-                    }
-                    if final_obj.get("showType") != "Movie":
-                        missing_fields.update({"airedOn", "network"})
+                    missing_fields = (
+                        MOVIE_METADATA_LABELS
+                        if final_obj.get("showType") == "Movie"
+                        else METADATA_LABELS
+                    )
+                    spu = final_obj.get("sitePriorityUsed", {})
                     missing = [
-                        human_readable_field(k)
-                        for k in missing_fields
-                        if is_empty_val(final_obj.get(k))
-                        and final_obj.get("sitePriorityUsed", {}).get(k) != "Manual"
+                        label
+                        for k, label in missing_fields
+                        if is_empty_val(final_obj.get(k)) and spu.get(k) != "Manual"
                     ]
                     if missing:
                         report.setdefault("missing_warnings_asian", []).append(
-                            f"- {sid} - {final_obj['showName']} ({final_obj.get('releasedYear')}) -> ⚠️ Missing: {', '.join(sorted(missing))}"
+                            f"- {sid} - {final_obj['showName']} ({final_obj.get('releasedYear')}) -> ⚠️ Missing: {', '.join(missing)}"
                         )
-                context["processed_ids_all_runs"].add(sid)
+                processed_ids.add(sid)
             else:
                 lang = excel_obj.get("nativeLanguage", "").lower()
-                if lang in [
-                    "korean",
-                    "chinese",
-                    "japanese",
-                    "thai",
-                    "taiwanese",
-                    "filipino",
-                ]:
+                if lang in ASIAN_LANGUAGES:
                     report.setdefault("skipped", []).append(
                         f"{sid} - {excel_obj['showName']} ({excel_obj.get('releasedYear')})"
                     )
@@ -2641,9 +3308,15 @@ def main():
                     report.setdefault("ignored_non_asian", []).append(
                         f"{sid} - {excel_obj['showName']} ({excel_obj.get('releasedYear')})"
                     )
-                context["processed_ids_all_runs"].add(sid)
+                processed_ids.add(sid)
+
+    for future in context.pop("prefetched").values():
+        future.cancel()
+    flush_backups(context)
+    # Drop the parses a stopped run never reached before releasing the workbook.
+    sheet_pool.shutdown(cancel_futures=True)
+    xl.close()
 
-    os.makedirs(REPORTS_DIR, exist_ok=True)
     ts = context["file_ts"]
     first_run = context.get("first_run_id", current_gh_run)
     if limit_reached:
@@ -2668,20 +3341,40 @@ def main():
         if os.path.exists("RESUME_FLAG.txt"):
             os.remove("RESUME_FLAG.txt")
 
-    save_json_file(
-        SERIES_JSON_FILE,
-        sorted(merged_by_id.values(), key=lambda x: int(x.get("showID") or 0)),
-    )
-    save_json_file(ARTISTS_JSON_FILE, artists_data)
-    save_json_file(CAST_JSON_FILE, cast_data)
-
-    artist_lookup_list = [
-        {"artistID": k, "artistName": v["artistName"]} for k, v in artists_data.items()
-    ]
-    save_json_file(
-        ARTIST_LOOKUP_FILE, sorted(artist_lookup_list, key=lambda x: x["artistName"])
-    )
+    # Like cast.json and the artist files below, seriesData.json is only
+    # re-encoded when this run changed or deleted a show.
+    json_writes = []
+    if series_updated or not os.path.exists(SERIES_JSON_FILE):
+        json_writes.append((SERIES_JSON_FILE, series_in_id_order(merged_by_id)))
+
+    # Artists are only ever added and cast.json only changes when a show's cast
+    # is scraped, so runs that touched neither skip re-encoding those files.
+    if cast_updated or not os.path.exists(CAST_JSON_FILE):
+        json_writes.append((CAST_JSON_FILE, cast_data))
+    if len(artists_data) != initial_artist_count or not (
+        os.path.exists(ARTISTS_JSON_FILE) and os.path.exists(ARTIST_LOOKUP_FILE)
+    ):
+        json_writes.append((ARTISTS_JSON_FILE, artists_data))
+        artist_lookup_list = [
+            {"artistID": k, "artistName": v["artistName"]}
+            for k, v in artists_data.items()
+        ]
+        artist_lookup_list.sort(key=itemgetter("artistName"))
+        json_writes.append((ARTIST_LOOKUP_FILE, artist_lookup_list))
+    context["object_counts"] = {
+        SERIES_JSON_FILE: len(merged_by_id),
+        ARTISTS_JSON_FILE: len(artists_data),
+        CAST_JSON_FILE: len(cast_data),
+        ARTIST_LOOKUP_FILE: len(artists_data),
+    }
 
+    # The JSON files are saved side by side, and every save must succeed
+    # before the report says the run finished; a failed write fails the run.
+    if json_writes:
+        with ThreadPoolExecutor(max_workers=len(json_writes)) as pool:
+            saves = [pool.submit(save_json_file, *write) for write in json_writes]
+            for save in saves:
+                save.result()
     write_report(
         context,
         current_run_seconds=duration,
@@ -0,0 +1,96 @@
+import os
+
+# Keep the import from opening http_cache.sqlite in the working tree; each
+# test installs its own fake cache on SCRAPER instead.
+os.environ["NO_HTTP_CACHE"] = "true"
+
+import pytest
+
+import create_update_backup_delete as cubd
+
+CACHED_URL = "https://mydramalist.com/1-cached"
+FRESH_URL = "https://mydramalist.com/2-fresh"
+PAGE = b'<div class="box-body"><b>Country:</b> South Korea</div>'
+
+
+class FakeCachedResponse:
+    is_expired = False
+
+
+class FakeCache:
+    def __init__(self, cached_urls):
+        self.cached_urls = cached_urls
+
+    def create_key(self, request):
+        return request.url
+
+    def get_response(self, key):
+        return FakeCachedResponse() if key in self.cached_urls else None
+
+
+class FakeResponse:
+    status_code = 200
+    content = PAGE
+
+
+class FakeScraper:
+    def __init__(self, cached_urls):
+        self.cache = FakeCache(cached_urls)
+        self.requested = []
+
+    def get(self, url, **kwargs):
+        self.requested.append(url)
+        return FakeResponse()
+
+
+@pytest.fixture
+def throttled(monkeypatch):
+    hosts = []
+    monkeypatch.setattr(cubd, "SCRAPER", FakeScraper({CACHED_URL}))
+    monkeypatch.setattr(cubd, "throttle", hosts.append)
+    monkeypatch.setattr(cubd, "_PAGE_SOUPS", cubd.OrderedDict())
+    monkeypatch.setattr(cubd, "_PAGE_LABEL_TAGS", {})
+    monkeypatch.setattr(cubd, "_FAILED_URLS", set())
+    monkeypatch.setattr(cubd, "_UNMARKED_URLS", set())
+    monkeypatch.setattr(cubd, "_RESOLVED_PAGE_URLS", {})
+    return hosts
+
+
+def test_cached_page_does_not_take_a_token(throttled):
+    assert cubd.fetch_page_soup(CACHED_URL, b"box-body") is not None
+    assert throttled == []
+    assert cubd.SCRAPER.requested == [CACHED_URL]
+
+
+def test_uncached_page_is_throttled(throttled):
+    assert cubd.fetch_page_soup(FRESH_URL, b"box-body") is not None
+    assert throttled == ["mydramalist.com"]
+
+
+def test_expired_cache_entry_is_throttled(throttled, monkeypatch):
+    monkeypatch.setattr(FakeCachedResponse, "is_expired", True)
+    cubd.fetch_page_soup(CACHED_URL, b"box-body")
+    assert throttled == ["mydramalist.com"]
+
+
+def test_page_without_marker_is_not_refetched(throttled):
+    assert cubd.fetch_page_soup(FRESH_URL, b"film-title") is None
+    assert cubd.fetch_page_soup(FRESH_URL, b"film-title") is None
+    assert cubd.SCRAPER.requested == [FRESH_URL]
+
+
+def test_search_miss_on_page_content_is_remembered(throttled, monkeypatch):
+    monkeypatch.setattr(cubd, "HAVE_DDGS", True)
+    monkeypatch.setattr(cubd, "search_ddgs", lambda query: [{"href": FRESH_URL}])
+    monkeypatch.setitem(cubd.SITE_LANDMARK_MARKERS, "mydramalist", b"film-title")
+    args = ("Show", "Show", 2020, "mydramalist", "korean", "Drama")
+    assert cubd.get_soup_from_search(*args, {}) == (None, None)
+    assert cubd._RESOLVED_PAGE_URLS == {args: None}
+
+
+def test_search_miss_on_empty_results_is_not_remembered(throttled, monkeypatch):
+    monkeypatch.setattr(cubd, "HAVE_DDGS", True)
+    monkeypatch.setattr(cubd, "search_ddgs", lambda query: [])
+    args = ("Show", "Show", 2020, "mydramalist", "korean", "Drama")
+    assert cubd.get_soup_from_search(*args, {}) == (None, None)
+    assert cubd._RESOLVED_PAGE_URLS == {}
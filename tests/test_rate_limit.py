@@ -0,0 +1,43 @@
+import os
+
+os.environ["NO_HTTP_CACHE"] = "true"
+
+import pytest
+
+import create_update_backup_delete as cubd
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cubd.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(cubd, "_BACKOFF", {})
+    return now
+
+
+def test_refusal_halves_the_configured_rate(clock):
+    cubd.slow_down("mydramalist.com")
+    with cubd._THROTTLE_LOCK:
+        assert cubd._host_rate("mydramalist.com", clock[0]) == (0.25, 1)
+
+
+def test_backoff_lapses_after_the_cooldown(clock):
+    cubd.slow_down("mydramalist.com")
+    clock[0] += cubd.BACKOFF_COOLDOWN
+    with cubd._THROTTLE_LOCK:
+        assert cubd._host_rate("mydramalist.com", clock[0]) == (0.5, 3)
+    assert cubd._BACKOFF == {}
+
+
+def test_unlisted_host_is_only_limited_while_backed_off(clock):
+    cubd.slow_down("i.mydramalist.com")
+    with cubd._THROTTLE_LOCK:
+        assert cubd._host_rate("i.mydramalist.com", clock[0]) == (1.0, 1)
+        clock[0] += cubd.BACKOFF_COOLDOWN
+        assert cubd._host_rate("i.mydramalist.com", clock[0]) == (0, 0)
+
+
+def test_backoff_never_drops_below_the_floor(clock):
+    for _ in range(20):
+        cubd.slow_down("asianwiki.com")
+    assert cubd._BACKOFF["asianwiki.com"][0] == 1.0 / cubd.MAX_BACKOFF_DELAY
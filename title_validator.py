@@ -21,6 +21,27 @@ except ImportError:
     except ImportError:
         pass
 
+# orjson reads/writes the batch state faster than the stdlib json module; json is the fallback
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+
+# lxml is a C parser, much faster than the pure-Python html.parser; html.parser is the fallback
+try:
+    import lxml
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# python-calamine (Rust) parses .xlsx several times faster than openpyxl
+try:
+    import python_calamine
+    EXCEL_ENGINE = "calamine"
+except ImportError:
+    EXCEL_ENGINE = "openpyxl"
+
 # Setup Timezone (IST)
 IST = timezone(timedelta(hours=5, minutes=30))
 
@@ -52,21 +73,33 @@ LANG_TO_COUNTRY = {
     "filipino": "Philippines"
 }
 
+# Patterns used on every search result and scraped page, compiled once
+SEASON_SUFFIX_RE = re.compile(r'\b(?:season|part|s)\s*\d+\b|\s+\d+$', re.IGNORECASE)
+PARENTHESIZED_RE = re.compile(r"\(.*?\)")
+MDL_URL_RE = re.compile(r'(mydramalist\.com/[0-9]+-[^/]+)')
+IMDB_URL_RE = re.compile(r'(imdb\.com/title/tt[0-9]+)')
+COUNTRY_LABEL_RE = re.compile(r'Country:?')
+AIRED_LABEL_RE = re.compile(r'Aired:?')
+TYPE_LABEL_RE = re.compile(r'Type:?')
+WHITESPACE_RE = re.compile(r'\s+')
+YEAR_RE = re.compile(r'\b(19|20)\d{2}\b')
+TRAILING_YEAR_RE = re.compile(r"\s*\(\d{4}\)$")
+
 def names_are_similar(expected, scraped):
     if not expected or not scraped: return False
-    e_clean = re.sub(r'\b(?:season|part|s)\s*\d+\b|\s+\d+$', '', expected.lower()).strip()
-    s_clean = re.sub(r'\b(?:season|part|s)\s*\d+\b|\s+\d+$', '', scraped.lower()).strip()
+    e_clean = SEASON_SUFFIX_RE.sub('', expected.lower()).strip()
+    s_clean = SEASON_SUFFIX_RE.sub('', scraped.lower()).strip()
     
     if e_clean in s_clean or s_clean in e_clean: return True
     ratio = SequenceMatcher(None, e_clean, s_clean).ratio()
     return ratio >= 0.4
 
 def search_and_verify_title(search_term, expected_year, lang, sheet_name, site):
-    clean_search = re.sub(r"\(.*?\)", "", str(search_term)).strip()
+    clean_search = PARENTHESIZED_RE.sub("", str(search_term)).strip()
     
     # Strip Season for IMDb (Western Shows) to find the Master Page
     if site == "imdb":
-        clean_search = re.sub(r"\b(?:Season|Part|S)\s*\d+\b|\s+\d+$", "", clean_search, flags=re.IGNORECASE).strip()
+        clean_search = SEASON_SUFFIX_RE.sub("", clean_search).strip()
     
     queries = []
     if expected_year and expected_year != 0:
@@ -102,7 +135,7 @@ def search_and_verify_title(search_term, expected_year, lang, sheet_name, site):
             
             # --- URL CHOPPING (The Sub-Page Killer) ---
             if site == "mydramalist":
-                match = re.search(r'(mydramalist\.com/[0-9]+-[^/]+)', raw_url)
+                match = MDL_URL_RE.search(raw_url)
                 if match:
                     url = "https://" + match.group(1)
                 else:
@@ -110,7 +143,7 @@ def search_and_verify_title(search_term, expected_year, lang, sheet_name, site):
                     fail_detail = "Only found non-drama pages (actors/articles)"
                     continue
             elif site == "imdb":
-                match = re.search(r'(imdb\.com/title/tt[0-9]+)', raw_url)
+                match = IMDB_URL_RE.search(raw_url)
                 if match:
                     url = "https://www." + match.group(1) + "/"
                 else:
@@ -128,7 +161,7 @@ def search_and_verify_title(search_term, expected_year, lang, sheet_name, site):
                     r = SCRAPER.get(url, timeout=12)
 
                 if r.status_code == 200:
-                    soup = BeautifulSoup(r.text, "html.parser")
+                    soup = BeautifulSoup(r.text, HTML_PARSER)
                     title = None
                     scraped_year = 0
                     scraped_country = ""
@@ -139,16 +172,16 @@ def search_and_verify_title(search_term, expected_year, lang, sheet_name, site):
                         h1 = soup.find("h1", class_="film-title")
                         if h1: title = h1.get_text(strip=True)
                         
-                        country_tag = soup.find('b', string=re.compile(r'Country:?'))
+                        country_tag = soup.find('b', string=COUNTRY_LABEL_RE)
                         if country_tag and country_tag.next_sibling:
-                            scraped_country = re.sub(r'\s+', ' ', str(country_tag.next_sibling)).strip().lower()
+                            scraped_country = WHITESPACE_RE.sub(' ', str(country_tag.next_sibling)).strip().lower()
                             
-                        aired_tag = soup.find('b', string=re.compile(r'Aired:?'))
+                        aired_tag = soup.find('b', string=AIRED_LABEL_RE)
                         if aired_tag and aired_tag.parent:
-                            match = re.search(r'\b(19|20)\d{2}\b', aired_tag.parent.get_text())
+                            match = YEAR_RE.search(aired_tag.parent.get_text())
                             if match: scraped_year = int(match.group())
                             
-                        type_tag = soup.find('b', string=re.compile(r'Type:?'))
+                        type_tag = soup.find('b', string=TYPE_LABEL_RE)
                         if type_tag and type_tag.next_sibling:
                             scraped_type = type_tag.next_sibling.strip().lower()
 
@@ -157,7 +190,7 @@ def search_and_verify_title(search_term, expected_year, lang, sheet_name, site):
                         if h1: title = h1.get_text(strip=True)
                         
                         if soup.title:
-                            match = re.search(r'\b(19|20)\d{2}\b', soup.title.get_text())
+                            match = YEAR_RE.search(soup.title.get_text())
                             if match: scraped_year = int(match.group())
 
                     if not title: 
@@ -165,7 +198,7 @@ def search_and_verify_title(search_term, expected_year, lang, sheet_name, site):
                         fail_detail = "Failed to parse page title"
                         continue
                         
-                    title = re.sub(r"\s*\(\d{4}\)$", "", title).strip()
+                    title = TRAILING_YEAR_RE.sub("", title).strip()
 
                     # ==========================================
                     # THE ULTIMATE SECURITY CHECKPOINT
@@ -259,10 +292,13 @@ def write_report(current_report, state, current_run_seconds, run_start_time, is_
     is_manual = os.environ.get('GITHUB_EVENT_NAME') == 'workflow_dispatch'
     trigger_type = "Manual" if is_manual else "Automatic"
     current_gh_run = os.environ.get('GITHUB_RUN_NUMBER', 'Local')
+    # One clock read and one format per report: console, file and email share the same end time
+    end_time = now_ist()
+    end_time_ist = end_time.strftime("%d %B %Y - %I:%M:%S %p")
+    run_start_ist = run_start_time.strftime("%d %B %Y - %I:%M:%S %p")
 
     def build_report_text(rep_data, is_cumulative):
         first_run = state.get('first_run_id', current_gh_run)
-        end_time_ist = now_ist().strftime("%d %B %Y - %I:%M:%S %p")
         
         if is_cumulative:
             total_seconds = int(state.get('cumulative_time_seconds', 0) + current_run_seconds)
@@ -275,7 +311,7 @@ def write_report(current_report, state, current_run_seconds, run_start_time, is_
         else:
             total_seconds = int(current_run_seconds)
             run_display = f"{current_gh_run}"
-            start_time_str = run_start_time.strftime("%d %B %Y - %I:%M:%S %p")
+            start_time_str = run_start_ist
             run_label = "⏱️ Run Time      : "
             batch_label = f"🔄 Current Batch : {state.get('batch_run_count', 1)}"
             if is_paused:
@@ -373,7 +409,7 @@ def write_report(current_report, state, current_run_seconds, run_start_time, is_
             f.write(f"### 📊 Title Validation Output (Run: {current_gh_run})\n```text\n" + console_output + "\n```\n")
 
     os.makedirs(REPORTS_DIR, exist_ok=True)
-    ts = now_ist().strftime("%d_%B_%Y_%H%M")
+    ts = end_time.strftime("%d_%B_%Y_%H%M")
     
     cumulative_report = combine_reports(state.get("report_data", {}), current_report)
 
@@ -388,10 +424,20 @@ def write_report(current_report, state, current_run_seconds, run_start_time, is_
         file_output = build_report_text(cumulative_report, is_cumulative=True)
         with open(report_path, "w", encoding="utf-8") as f: f.write(file_output)
 
-    mail_date = now_ist().strftime("%d %B %Y %I:%M %p IST")
+    mail_date = end_time.strftime("%d %B %Y %I:%M %p IST")
     email_subject = f"[{trigger_type}] Title Validation {mail_date} Report"
     with open("EMAIL_SUBJECT.txt", "w", encoding='utf-8') as ef: ef.write(email_subject)
 
+def load_state():
+    with open(STATE_FILE, "rb") as f:
+        raw = f.read()
+    return orjson.loads(raw) if HAVE_ORJSON else json.loads(raw)
+
+def dump_state(state):
+    payload = orjson.dumps(state) if HAVE_ORJSON else json.dumps(state).encode("utf-8")
+    with open(STATE_FILE, "wb") as f:
+        f.write(payload)
+
 def main():
     run_start_time = now_ist()
     MAX_FETCHES = int(os.environ.get("MAX_FETCHES", "50"))
@@ -400,7 +446,7 @@ def main():
     current_gh_run = os.environ.get('GITHUB_RUN_NUMBER', 'Local')
 
     if os.path.exists(STATE_FILE):
-        with open(STATE_FILE, "r", encoding="utf-8") as f: state = json.load(f)
+        state = load_state()
     else:
         state = {
             "sheet_idx": 0, "row_idx": 0, "report_data": {},
@@ -413,7 +459,9 @@ def main():
     with open("EXCEL_FILE_ID.txt", "r") as f: main_excel_id = f.read().strip()
 
     excel_bytes = fetch_excel_from_gdrive_bytes(main_excel_id, "GDRIVE_SERVICE_ACCOUNT.json")
-    xl = pd.ExcelFile(io.BytesIO(excel_bytes.getvalue()))
+    # The download is already an in-memory buffer; the workbook is opened once
+    # and each sheet parsed from it.
+    xl = pd.ExcelFile(excel_bytes, engine=EXCEL_ENGINE)
 
     # --- RETRY LOGIC FOR GOOGLE SHEETS ---
     for attempt in range(3):
@@ -457,7 +505,7 @@ def main():
         target_sheet = next((s for s in xl.sheet_names if s.strip().lower() == sheet_name.strip().lower()), None)
         if not target_sheet: continue
 
-        df_in = pd.read_excel(xl, sheet_name=target_sheet)
+        df_in = xl.parse(sheet_name=target_sheet)
         subset_cols = [c for c in ["Show ID", "No"] if c in df_in.columns]
         if subset_cols: df_in = df_in.dropna(how="all", subset=subset_cols)
 
@@ -609,7 +657,7 @@ def main():
         state["batch_run_count"] += 1
         state["cumulative_time_seconds"] += current_run_seconds
         with open("RESUME_FLAG.txt", "w") as f: f.write("CONTINUE")
-        with open(STATE_FILE, "w", encoding="utf-8") as f: json.dump(state, f)
+        dump_state(state)
     else:
         if os.path.exists(STATE_FILE): os.remove(STATE_FILE)
 